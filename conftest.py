@@ -0,0 +1,133 @@
+"""
+Shared fixtures for the Qt test modules.
+"""
+
+import copy
+import os
+import pytest
+
+# Run Qt without a display unless a platform was chosen explicitly; this
+# must happen before any Qt module is imported
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+def pytest_addoption(parser):
+    parser.addoption("--fast-ui", action="store_true",
+                     help="skip OpenGL initialization and painting in the viewport")
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "serial: run on a single xdist worker (shares state across processes)")
+
+# Fixtures that need a working Qt platform
+_QT_FIXTURES = {"qapp", "qtbot", "main_window"}
+
+def _qt_available():
+    """Check PyQt6 imports and has a plugin for the selected Qt platform.
+
+    A QApplication cannot be tried out instead: a missing platform plugin
+    aborts the process rather than raising.
+    """
+    try:
+        from PyQt6.QtCore import QLibraryInfo
+        import PyQt6.QtWidgets  # noqa: F401
+    except ImportError:
+        return False
+    platforms = os.path.join(QLibraryInfo.path(QLibraryInfo.LibraryPath.PluginsPath), "platforms")
+    platform = os.environ["QT_QPA_PLATFORM"].split(":")[0]
+    return os.path.isdir(platforms) and any(
+        os.path.splitext(name)[0] in (f"libq{platform}", f"q{platform}")
+        for name in os.listdir(platforms))
+
+def pytest_collection_modifyitems(config, items):
+    # Skip GUI tests up front when Qt cannot start, instead of failing
+    # each one during window setup
+    if not _qt_available():
+        skip_qt = pytest.mark.skip(reason="Qt platform not available")
+        for item in items:
+            if _QT_FIXTURES.intersection(getattr(item, "fixturenames", ())):
+                item.add_marker(skip_qt)
+
+    # Under --dist=loadgroup, keep every serial test on the same worker
+    for item in items:
+        if item.get_closest_marker("serial"):
+            item.add_marker(pytest.mark.xdist_group("serial"))
+
+# Shape attributes holding mesh data, which clones share with their template
+_MESH_ATTRS = ("vertices", "normals", "indices")
+
+def _clone_shape(template):
+    """Copy a shape, sharing its mesh but not its transform or state."""
+    from PyQt6.QtGui import QVector3D
+    shape = copy.copy(template)
+    for name, value in vars(template).items():
+        if isinstance(value, QVector3D):
+            setattr(shape, name, QVector3D(value))
+        elif name not in _MESH_ATTRS:
+            setattr(shape, name, copy.deepcopy(value))
+    return shape
+
+@pytest.fixture(scope="session")
+def shape_templates():
+    """Build the meshes of the shapes tests use once per session."""
+    from shapes_3d import Cube, Sphere
+    return {"cube": Cube(size=1.0), "sphere": Sphere(radius=0.5)}
+
+@pytest.fixture
+def make_cube(shape_templates):
+    """Get a factory for fresh unit cubes."""
+    return lambda: _clone_shape(shape_templates["cube"])
+
+@pytest.fixture
+def make_sphere(shape_templates):
+    """Get a factory for fresh spheres of radius 0.5."""
+    return lambda: _clone_shape(shape_templates["sphere"])
+
+@pytest.fixture(scope="session")
+def _fast_ui(request):
+    """With --fast-ui, turn the viewport's GL callbacks into no-ops.
+
+    Tests assert on scene and mode state, not on what was drawn, so they
+    can skip creating and rendering into a GL context.
+    """
+    if not request.config.getoption("--fast-ui"):
+        yield
+        return
+    from viewport import Viewport
+    with pytest.MonkeyPatch.context() as mp:
+        for name in ("initializeGL", "resizeGL", "paintGL"):
+            mp.setattr(Viewport, name, lambda self, *args: None)
+        yield
+
+@pytest.fixture(scope="session")
+def qapp(qapp):
+    """Get pytest-qt's QApplication with the plain Fusion style and no stylesheet.
+
+    Tests then do not depend on, or pay for, the platform's native style.
+    """
+    qapp.setStyle("Fusion")
+    qapp.setStyleSheet("")
+    return qapp
+
+@pytest.fixture(scope="module")
+def _main_window(qapp, _fast_ui):
+    """Create one main window per test module.
+
+    Building the window (OpenGL viewport, tabs, scene manager) dominates GUI
+    test setup, so tests share it and main_window resets it between them.
+    """
+    from main import CADCAMMainWindow
+    window = CADCAMMainWindow()
+    yield window
+    window.close()
+    window.deleteLater()
+
+@pytest.fixture
+def main_window(_main_window):
+    """Get the module's main window with its scene, modes and status reset."""
+    viewport = _main_window.viewport
+    viewport.scene_manager.shapes.clear()
+    viewport.scene_manager.selected_shape = None
+    viewport.transform_mode = None
+    viewport.status_message = ""
+    _main_window.shape_ids.clear()
+    return _main_window
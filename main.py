@@ -1,7 +1,8 @@
 import sys
+from functools import partial
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                            QHBoxLayout, QTabWidget, QLabel)
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QKeyCombination
 from PyQt6.QtGui import QVector3D
 from shapes_tab import ShapesTab
 from transform_tab import TransformTab
@@ -9,8 +10,32 @@ from viewport import Viewport
 from shapes_3d import Cube, Sphere, Cylinder
 from PyQt6.QtWidgets import QShortcut
 from PyQt6.QtGui import QKeySequence
+from window_layout import VIEWPORT_STRETCH, PANEL_STRETCH
 
 class CADCAMMainWindow(QMainWindow):
+    # Keyboard shortcuts: key sequence -> (handler method, arguments)
+    SHORTCUTS = {
+        # Transform mode shortcuts
+        "T": ("onTransformModeChanged", ("translate",)),
+        "R": ("onTransformModeChanged", ("rotate",)),
+        "S": ("onTransformModeChanged", ("scale",)),
+        # Axis selection shortcuts
+        "Alt+X": ("onAxisSelected", ("x",)),
+        "Alt+Y": ("onAxisSelected", ("y",)),
+        "Alt+Z": ("onAxisSelected", ("z",)),
+        # Snapping shortcut
+        "Ctrl+G": ("toggleSnapping", ()),
+        # Cancel transform mode
+        "Esc": ("cancelTransform", ()),
+        # Apply transform
+        "Return": ("applyCurrentTransform", ()),
+        # Toggle relative mode
+        "Alt+R": ("toggleRelativeMode", ()),
+        # Undo/Redo
+        "Ctrl+Z": ("undoTransform", ()),
+        "Ctrl+Y": ("redoTransform", ()),
+    }
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("CAD/CAM Program")
@@ -23,12 +48,12 @@ class CADCAMMainWindow(QMainWindow):
         
         # Create OpenGL viewport
         self.viewport = Viewport()
-        main_layout.addWidget(self.viewport, stretch=2)
+        main_layout.addWidget(self.viewport, stretch=VIEWPORT_STRETCH)
         
         # Create right panel with tabs
         right_panel = QWidget()
         right_layout = QVBoxLayout(right_panel)
-        tab_widget = QTabWidget()
+        self.tab_widget = QTabWidget()
         
         # Create and initialize tabs
         self.shapes_tab = ShapesTab()
@@ -45,14 +70,14 @@ class CADCAMMainWindow(QMainWindow):
         constraints_tab = QWidget()
         
         # Add tabs to tab widget
-        tab_widget.addTab(self.shapes_tab, "Shapes")
-        tab_widget.addTab(self.transform_tab, "Transform")
-        tab_widget.addTab(boolean_tab, "Boolean")
-        tab_widget.addTab(cam_tab, "CAM")
-        tab_widget.addTab(constraints_tab, "Constraints")
+        self.tab_widget.addTab(self.shapes_tab, "Shapes")
+        self.tab_widget.addTab(self.transform_tab, "Transform")
+        self.tab_widget.addTab(boolean_tab, "Boolean")
+        self.tab_widget.addTab(cam_tab, "CAM")
+        self.tab_widget.addTab(constraints_tab, "Constraints")
         
-        right_layout.addWidget(tab_widget)
-        main_layout.addWidget(right_panel, stretch=1)
+        right_layout.addWidget(self.tab_widget)
+        main_layout.addWidget(right_panel, stretch=PANEL_STRETCH)
         
         # Store shape IDs for reference
         self.shape_ids = {}
@@ -62,43 +87,21 @@ class CADCAMMainWindow(QMainWindow):
         
     def setupShortcuts(self):
         """Set up keyboard shortcuts."""
-        # Transform mode shortcuts
-        QShortcut(QKeySequence("T"), self).activated.connect(
-            lambda: self.onTransformModeChanged("translate"))
-        QShortcut(QKeySequence("R"), self).activated.connect(
-            lambda: self.onTransformModeChanged("rotate"))
-        QShortcut(QKeySequence("S"), self).activated.connect(
-            lambda: self.onTransformModeChanged("scale"))
-        
-        # Axis selection shortcuts
-        QShortcut(QKeySequence("Alt+X"), self).activated.connect(
-            lambda: self.onAxisSelected("x"))
-        QShortcut(QKeySequence("Alt+Y"), self).activated.connect(
-            lambda: self.onAxisSelected("y"))
-        QShortcut(QKeySequence("Alt+Z"), self).activated.connect(
-            lambda: self.onAxisSelected("z"))
-        
-        # Snapping shortcut
-        QShortcut(QKeySequence("Ctrl+G"), self).activated.connect(
-            self.toggleSnapping)
-        
-        # Cancel transform mode
-        QShortcut(QKeySequence("Esc"), self).activated.connect(
-            self.cancelTransform)
-            
-        # Apply transform
-        QShortcut(QKeySequence("Return"), self).activated.connect(
-            self.applyCurrentTransform)
-            
-        # Toggle relative mode
-        QShortcut(QKeySequence("Alt+R"), self).activated.connect(
-            self.toggleRelativeMode)
+        for sequence, (method, args) in self.SHORTCUTS.items():
+            QShortcut(QKeySequence(sequence), self).activated.connect(
+                partial(getattr(self, method), *args))
             
-        # Undo/Redo
-        QShortcut(QKeySequence("Ctrl+Z"), self).activated.connect(
-            self.undoTransform)
-        QShortcut(QKeySequence("Ctrl+Y"), self).activated.connect(
-            self.redoTransform)
+    def _handle_shortcut(self, key, modifiers=Qt.KeyboardModifier.NoModifier):
+        """Run the action bound to a key press without going through Qt events.
+        
+        Returns True if the key press has a shortcut.
+        """
+        sequence = QKeySequence(QKeyCombination(modifiers, key)).toString()
+        if sequence not in self.SHORTCUTS:
+            return False
+        method, args = self.SHORTCUTS[sequence]
+        getattr(self, method)(*args)
+        return True
             
     def applyCurrentTransform(self):
         """Apply the current transform using the Enter key."""
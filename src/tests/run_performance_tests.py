@@ -1,11 +1,10 @@
 import unittest
-import json
 import os
 from datetime import datetime
 import numpy as np
 from .test_transform_performance import TestTransformPerformance
 from ..utils.logging import TransformLogger
-from ..utils.visualization import PerformanceVisualizer
+from ..utils.visualization import PerformanceVisualizer, dump_json
 
 class PerformanceTestRunner:
     """Runs performance tests and generates reports."""
@@ -106,77 +105,52 @@ class PerformanceTestRunner:
             self.logger.error("No test results available")
             return
         
-        # Create report filename with timestamp
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        report_file = f'reports/performance_report_{timestamp}.json'
-        
-        # Generate visualizations
-        image_files = []
-        
-        # Batch transform visualizations
-        if 'batch_transform' in self.metrics:
-            metrics = self.metrics['batch_transform']
+        # Stamp the JSON report, charts and HTML report alike
+        with self.visualizer.report_session() as timestamp:
+            report_file = f'reports/performance_report_{timestamp}.json'
             
-            # Duration line plot
-            duration_plot = self.visualizer.plot_transform_durations(
-                metrics['shape_counts'],
-                metrics['durations'],
-                'batch'
-            )
-            image_files.append(duration_plot)
+            # Generate visualizations
+            image_files = []
             
-            # Memory usage bar plot
-            memory_plot = self.visualizer.plot_memory_usage(
-                metrics['shape_counts'],
-                metrics['memory_usage'],
-                'batch'
-            )
-            image_files.append(memory_plot)
+            # Batch transform visualizations
+            if 'batch_transform' in self.metrics:
+                metrics = self.metrics['batch_transform']
+                
+                # Duration line, memory usage bar and performance scatter plots
+                image_files.extend(self.visualizer.generate_all(
+                    metrics['shape_counts'],
+                    metrics['durations'],
+                    metrics['memory_usage'],
+                    'batch',
+                    scatter_title='Transform Performance Scaling'
+                ))
             
-            # Performance scatter plot
-            scatter_plot = self.visualizer.plot_performance_scatter(
-                metrics['shape_counts'],
-                metrics['durations'],
-                'Shape Count',
-                'Duration (ms)',
-                'Transform Performance Scaling'
-            )
-            image_files.append(scatter_plot)
-        
-        # Complex mesh visualizations
-        if 'complex_mesh' in self.metrics:
-            metrics = self.metrics['complex_mesh']
+            # Complex mesh visualizations
+            if 'complex_mesh' in self.metrics:
+                metrics = self.metrics['complex_mesh']
+                
+                # Duration line and memory usage bar plots
+                image_files.extend(self.visualizer.generate_all(
+                    metrics['vertex_counts'],
+                    metrics['durations'],
+                    metrics['memory_usage'],
+                    'complex'
+                ))
             
-            # Duration line plot
-            duration_plot = self.visualizer.plot_transform_durations(
-                metrics['vertex_counts'],
-                metrics['durations'],
-                'complex'
-            )
-            image_files.append(duration_plot)
+            # Add performance metrics to report data
+            report_data = {
+                'test_results': self.results,
+                'performance_metrics': self.metrics,
+                'system_info': self._get_system_info(),
+                'recommendations': self._generate_recommendations()
+            }
             
-            # Memory usage bar plot
-            memory_plot = self.visualizer.plot_memory_usage(
-                metrics['vertex_counts'],
-                metrics['memory_usage'],
-                'complex'
-            )
-            image_files.append(memory_plot)
-        
-        # Add performance metrics to report data
-        report_data = {
-            'test_results': self.results,
-            'performance_metrics': self.metrics,
-            'system_info': self._get_system_info(),
-            'recommendations': self._generate_recommendations()
-        }
-        
-        # Write JSON report
-        with open(report_file, 'w') as f:
-            json.dump(report_data, f, indent=2)
-        
-        # Generate HTML report
-        html_file = self.visualizer.generate_html_report(report_data, image_files)
+            # Write JSON report, indented for reading
+            with open(report_file, 'wb') as f:
+                f.write(dump_json(report_data, indent=True))
+            
+            # Generate HTML report
+            html_file = self.visualizer.generate_html_report(report_data, image_files)
         
         self.logger.info(
             f"Performance report and visualizations generated",
@@ -0,0 +1,390 @@
+"""
+Tests for the PerformanceVisualizer report helpers.
+"""
+
+import base64
+import gzip
+import json
+import os
+import subprocess
+import sys
+import numpy as np
+import plotly.graph_objs as go
+import pytest
+from src.utils import visualization
+from src.utils.visualization import PerformanceVisualizer, _js_string, _linfit, _lttb, _ndarray_to_b64
+
+@pytest.fixture
+def visualizer(tmp_path):
+    """Create a visualizer writing into a temporary directory."""
+    return PerformanceVisualizer(output_dir=str(tmp_path))
+
+def test_chart_sections(visualizer):
+    """Test chart sections embed each chart with a title from its filename."""
+    html = ''.join(visualizer._iter_chart_sections(['reports/memory_usage_batch_1.html']))
+    assert '<h3>Memory Usage</h3>' in html
+    assert 'reports/memory_usage_batch_1.html' in html
+
+def test_recommendation_sections(visualizer):
+    """Test recommendation sections carry priority, message and details."""
+    html = ''.join(visualizer._iter_recommendation_sections([
+        {'priority': 'high', 'message': 'Fix it', 'details': 'Too slow'},
+        {'priority': 'low', 'message': 'Tune it', 'details': 'Minor'}
+    ]))
+    assert '<div class="recommendation high"><h4>Fix it</h4><p>Too slow</p></div>' in html
+    assert 'recommendation low' in html
+
+def test_system_info_section(visualizer):
+    """Test system info keys are humanized and memory is shown in GB."""
+    html = ''.join(visualizer._iter_system_info_section({
+        'cpu_count': 8,
+        'memory_total': 2 * 1024**3
+    }))
+    assert '<li><strong>Cpu Count:</strong> 8</li>' in html
+    assert '<li><strong>Memory Total:</strong> 2.00 GB</li>' in html
+
+def test_file_stamps_share_run_timestamp(visualizer):
+    """Test files from one run share a timestamp but never collide."""
+    first = visualizer._file_stamp()
+    second = visualizer._file_stamp()
+    assert first != second
+    assert first.rsplit('_', 1)[0] == second.rsplit('_', 1)[0] == visualizer._now()
+
+def test_apply_filters(visualizer):
+    """Test min/max and range filters keep the expected points."""
+    values = [100, 500, 1000, 2000, 5000]
+    assert list(visualizer._apply_filters(values, {'min_value': 500, 'max_value': 2000})) == [
+        False, True, True, True, False]
+    assert list(visualizer._apply_filters(values, {'value_range': (0, 1000)})) == [
+        True, True, True, False, False]
+    assert not visualizer._apply_filters(values, {'min_value': 10000}).any()
+
+def test_comparison_reuses_filter_mask(visualizer, monkeypatch):
+    """Test comparison runs over the same shape counts are filtered once."""
+    calls = []
+    apply_filters = visualizer._apply_filters
+    monkeypatch.setattr(visualizer, '_apply_filters',
+                        lambda values, filters: calls.append(1) or apply_filters(values, filters))
+    shape_counts = [100, 500, 1000, 2000]
+    comparison = {'shape_counts': shape_counts, 'durations': [6.0, 21.0, 40.0, 90.0]}
+    visualizer.plot_transform_durations(shape_counts, [5.0, 20.0, 41.0, 88.0],
+                                        comparison_data=comparison, filters={'max_value': 1000})
+    assert len(calls) == 1
+
+def test_report_renders_own_charts_inline(visualizer):
+    """Test charts produced by the visualizer are rendered inline in reports."""
+    chart_file = visualizer.plot_memory_usage([100, 500], [10.0, 20.0])
+    html = ''.join(visualizer._iter_chart_sections([chart_file, 'external_chart.html']))
+    assert '<div id="chart_0" class="chart lazy-chart"></div>' in html
+    assert '<div class="lazy-chart" data-src="external_chart.html"></div>' in html
+    script = visualizer._generate_chart_script([chart_file, 'external_chart.html'])
+    assert '"chart_0": {' in script
+    assert 'chart_1' not in script
+
+def test_transform_durations_single_run(visualizer):
+    """Test a small single-run duration chart uses SVG traces and a two-point trend."""
+    chart_file = visualizer.plot_transform_durations([100, 500, 1000], [5.0, 20.0, 41.0])
+    fig = visualizer._chart_figures[chart_file]
+    assert [trace.type for trace in fig.data] == ['scatter', 'scatter']
+    assert list(fig.data[1].x) == [100, 1000]
+    assert '"dtype":"f8"' in fig.to_json().replace(' ', '')
+
+def test_lttb_downsampling():
+    """Test LTTB keeps the endpoints and isolated spikes of a long series."""
+    x = np.arange(10000)
+    y = np.zeros(10000)
+    y[5000] = 100.0
+    out_x, out_y = _lttb(x, y, n_out=100)
+    assert len(out_x) == len(out_y) == 100
+    assert out_x[0] == 0 and out_x[-1] == 9999
+    assert 5000 in out_x
+    assert out_y.max() == 100.0
+    
+    short_x, short_y = _lttb([1, 2, 3], [4, 5, 6])
+    assert list(short_x) == [1, 2, 3] and list(short_y) == [4, 5, 6]
+
+def test_lttb_sorts_unsorted_x():
+    """Test LTTB buckets unsorted points by x rather than by input order."""
+    rng = np.random.default_rng(0)
+    x = np.arange(5000.0)
+    y = np.sin(x / 300.0)
+    order = rng.permutation(5000)
+    out_x, out_y = _lttb(x[order], y[order], n_out=200)
+    sorted_x, sorted_y = _lttb(x, y, n_out=200)
+    assert np.array_equal(out_x, sorted_x) and np.array_equal(out_y, sorted_y)
+
+def test_large_scatter_uses_svg_after_downsampling(visualizer):
+    """Test the trace type follows the downsampled size, not the input size."""
+    x = np.arange(6000.0)
+    chart_file = visualizer.plot_performance_scatter(x, 2 * x, 'Shapes', 'Time', 'Scaling')
+    fig = visualizer._chart_figures[chart_file]
+    assert fig.data[0].type == 'scatter'
+    assert len(fig.data[0].x) == 2000
+
+def test_linfit_matches_polyfit():
+    """Test the closed-form line fit agrees with np.polyfit."""
+    rng = np.random.default_rng(0)
+    x = rng.uniform(0, 1000, 500)
+    y = 0.3 * x + 12 + rng.normal(0, 5, 500)
+    assert np.allclose(_linfit(x, y), np.polyfit(x, y, 1))
+
+def test_ndarray_to_b64():
+    """Test series encode to little-endian float64 bytes, lists and arrays alike."""
+    encoded = _ndarray_to_b64([1.5, 2.0])
+    assert np.array_equal(np.frombuffer(base64.b64decode(encoded), dtype='<f8'), [1.5, 2.0])
+    assert _ndarray_to_b64(np.array([100, 500])[::-1]) == _ndarray_to_b64([500.0, 100.0])
+
+def test_charts_use_perf_template(visualizer):
+    """Test charts pick up the shared layout from the perf template."""
+    chart_file = visualizer.plot_memory_usage([100, 500], [10.0, 20.0])
+    layout = visualizer._chart_figures[chart_file].layout
+    assert layout.template.layout.margin.t == 100
+    assert layout.template.layout.title.x == 0.5
+    assert layout.showlegend is False
+    assert not layout.annotations
+
+def test_list_available_runs(visualizer, tmp_path):
+    """Test saved runs are listed newest first and other files are ignored."""
+    assert visualizer.list_available_runs() == []
+    (tmp_path / 'data').mkdir()
+    for name in ('test_data_20240101_000000.json', 'test_data_20240102_000000.json', 'notes.txt'):
+        (tmp_path / 'data' / name).write_text('{}')
+    (tmp_path / 'data' / 'test_data_20240103_000000.json').mkdir()
+    assert visualizer.list_available_runs() == ['20240102_000000', '20240101_000000']
+    assert visualizer.list_available_runs(limit=1) == ['20240102_000000']
+
+def test_save_and_load_test_data(visualizer):
+    """Test saved runs round-trip and re-saving refreshes the cached copy."""
+    run_id = visualizer.save_test_data({'shape_counts': [100, 500], 'durations': [1.5, 7.25]},
+                                       run_id='run_1')
+    assert visualizer.load_test_data(run_id) == {'shape_counts': [100, 500], 'durations': [1.5, 7.25]}
+    assert visualizer.load_test_data(run_id) is visualizer.load_test_data(run_id)
+    
+    visualizer.save_test_data({'shape_counts': [100], 'durations': [2.0]},
+                              run_id='run_1')
+    assert visualizer.load_test_data(run_id) == {'shape_counts': [100], 'durations': [2.0]}
+
+def test_trend_line_skipped_without_x_spread(visualizer):
+    """Test degenerate series get no trend line instead of failing to fit."""
+    fig = go.Figure()
+    visualizer._add_duration_traces(fig, [100], [5.0])
+    visualizer._add_duration_traces(fig, [100, 100], [5.0, 6.0])
+    assert len(fig.data) == 2
+    
+    chart_file = visualizer.plot_performance_scatter([10, 10], [1.0, 2.0], 'X', 'Y', 'Flat')
+    assert len(visualizer._chart_figures[chart_file].data) == 1
+
+def test_charts_share_local_plotlyjs(visualizer, tmp_path):
+    """Test charts reference one plotly.js bundle written into the output dir."""
+    chart_file = visualizer.plot_memory_usage([100, 500], [10.0, 20.0])
+    src = visualizer._plotlyjs_src()
+    assert (tmp_path / src).is_file()
+    with open(chart_file) as f:
+        assert f'src="{src}"' in f.read()
+
+def test_generate_all(visualizer):
+    """Test charts generated in parallel come back in a fixed order."""
+    chart_files = visualizer.generate_all([100, 500, 1000], [5.0, 20.0, 41.0], [10.0, 20.0, 30.0],
+                                          scatter_title='Scaling')
+    assert [os.path.basename(f).split('_')[0] for f in chart_files] == ['transform', 'memory', 'scatter']
+    assert all(f in visualizer._chart_figures for f in chart_files)
+    assert len(visualizer.generate_all([100, 500], [5.0, 20.0], [10.0, 20.0], 'complex')) == 2
+
+def test_validate_data(visualizer):
+    """Test validation reports bad values by index and truncates long runs."""
+    result = visualizer._validate_data([100, -1, 300], [5.0, float('nan'), 'slow'])
+    assert result['errors'] == [
+        "Negative shape count found at index 1: -1",
+        "Non-numeric value found in durations at index 2: slow",
+        "Invalid duration (NaN/Inf) found at index 1"
+    ]
+    
+    result = visualizer._validate_data(list(range(20)), [-1.0] * 20)
+    assert len(result['errors']) == 11
+    assert result['errors'][-1] == "... and 10 more"
+    assert visualizer._validate_data([100, 200], [1.0, 2.0]) == {'errors': [], 'warnings': []}
+
+def test_transform_durations_downsamples_large_series(visualizer, caplog):
+    """Test large series are downsampled for both the chart and embedded data."""
+    shape_counts = list(range(1, 6001))
+    durations = [0.5 * count for count in shape_counts]
+    with caplog.at_level('INFO'):
+        chart_file = visualizer.plot_transform_durations(shape_counts, durations)
+    fig = visualizer._chart_figures[chart_file]
+    assert len(fig.data[0].x) == 2000
+    # 2000 plotted points stay under the WebGL threshold
+    assert fig.data[0].type == 'scatter'
+    assert fig.layout.hoverdistance is None
+    assert "Downsampled 6000 points to 2000" in caplog.text
+    with open(chart_file) as f:
+        embedded = f.read().split('window.currentData', 1)[1]
+    shape_counts_b64 = embedded.split('shape_counts: b64ToF64("', 1)[1].split('"', 1)[0]
+    assert len(base64.b64decode(shape_counts_b64)) == 2000 * 8
+
+def test_duration_chart_script(visualizer):
+    """Test the duration chart script carries both runs and escaped messages."""
+    data = {'shape_counts': [100, 500], 'durations': [5.0, 20.0]}
+    chart_file = visualizer.plot_transform_durations(
+        data['shape_counts'], data['durations'], comparison_data=data)
+    with open(chart_file) as f:
+        html = f.read()
+    assert 'window.comparisonData = {current: window.currentData,' in html
+    assert html.count('shape_counts:') == 2
+    assert 'comparison: {shape_counts:' in html
+    assert '.validation-errors' not in html.split('validationStyle.textContent', 1)[0]
+    
+    validation_html = visualizer._format_validation_messages(
+        {'errors': [], 'warnings': ['</script><b>']})
+    assert '</script>' not in _js_string(validation_html)
+
+def test_dump_json_without_orjson(monkeypatch):
+    """Test the stdlib fallback writes compact JSON and accepts NumPy data."""
+    monkeypatch.setattr(visualization, 'orjson', None)
+    data = {'shape_counts': np.array([100, 500]), 'durations': [np.float64(1.5), 2.0]}
+    assert visualization.dump_json(data) == b'{"shape_counts":[100,500],"durations":[1.5,2.0]}'
+    assert visualization.dump_json(data, indent=True).startswith(b'{\n  "shape_counts": [\n    100,')
+
+def test_validate_comparison_data(visualizer):
+    """Test comparison warnings for differing shape counts and large duration gaps."""
+    current = {'shape_counts': [100, 500], 'durations': [10.0, 20.0]}
+    assert visualizer._validate_comparison_data(current, current)['warnings'] == []
+    
+    result = visualizer._validate_comparison_data(
+        current, {'shape_counts': [100, 600], 'durations': [10.0, 2000.0]})
+    assert result['warnings'] == [
+        "Shape count differences detected between current and comparison data",
+        "Significant duration differences detected (>1000ms)"
+    ]
+
+def test_validation_errors_are_bounded(visualizer):
+    """Test stored validation errors are capped and the summary shows the latest."""
+    for i in range(1100):
+        visualizer._validate_data([i], [-1.0])
+    errors = visualizer.validation_stats['validation_errors']
+    assert len(errors) == 1000
+    summary = visualizer.get_validation_summary()
+    assert summary['failed_validations'] == 1100
+    assert summary['recent_errors'] == list(errors)[-10:]
+    assert summary['recent_errors'][-1] == "Negative duration found at index 0: -1.0"
+
+def test_summary_json_cache(visualizer):
+    """Test the summary JSON is reused until another validation runs."""
+    first = visualizer._summary_json()
+    assert visualizer._summary_json() is first
+    visualizer._validate_data([100], [-1.0])
+    refreshed = visualizer._summary_json()
+    assert json.loads(refreshed) == visualizer.get_validation_summary()
+    assert json.loads(refreshed)['failed_validations'] == 1
+
+def test_render_batch(visualizer, tmp_path):
+    """Test a batch page holds every chart and loads plotly.js once."""
+    figures = [('Durations', go.Figure(go.Scatter(x=[1, 2], y=[3, 4]))),
+               ('Memory', go.Figure(go.Bar(x=[1, 2], y=[5, 6])))]
+    page = visualizer.render_batch(figures)
+    with open(page) as f:
+        html = f.read()
+    assert html.count('<script charset="utf-8" src=') == 1
+    assert '<div id="chart_1" class="chart lazy-chart"></div>' in html
+    assert '"chart_0": {' in html and '"chart_1": {' in html
+
+def test_validation_cache(visualizer):
+    """Test repeated validation within one call's cache reuses the result but still counts."""
+    shape_counts, durations = [100, 500], [5.0, -1.0]
+    cache = {}
+    first = visualizer._validate_data(shape_counts, durations, cache=cache)
+    second = visualizer._validate_data(shape_counts, durations, cache=cache)
+    assert first == second and first is not second
+    assert len(cache) == 1
+    assert visualizer.validation_stats['total_validations'] == 2
+    assert visualizer.validation_stats['failed_validations'] == 2
+
+def test_validation_sees_in_place_edits(visualizer):
+    """Test a series edited in place between plot calls is validated afresh."""
+    shape_counts, durations = list(range(10)), [1.0] * 10
+    assert visualizer._validate_data(shape_counts, durations)['errors'] == []
+    durations[3] = -5.0
+    errors = visualizer._validate_data(shape_counts, durations)['errors']
+    assert errors == ["Negative duration found at index 3: -5.0"]
+
+def test_plot_with_caller_timestamp(visualizer):
+    """Test a caller-supplied timestamp groups chart files under that stamp."""
+    chart_file = visualizer.plot_memory_usage([100, 500], [10.0, 20.0], timestamp='nightly')
+    assert os.path.basename(chart_file).startswith('memory_usage_batch_nightly_')
+    assert visualizer._now() in visualizer._file_stamp()
+
+def test_format_validation_messages(visualizer):
+    """Test validation messages render as error and warning blocks."""
+    assert visualizer._format_validation_messages({'errors': [], 'warnings': []}) == ""
+    html = visualizer._format_validation_messages({'errors': ['bad'], 'warnings': ['slow']})
+    assert html == ("<div class='validation-errors'><h3>Validation Errors:</h3>"
+                    "<p class='error-message'>bad</p></div>"
+                    "<div class='validation-warnings'><h3>Validation Warnings:</h3>"
+                    "<p class='warning-message'>slow</p></div>")
+
+def test_plotly_imported_on_first_chart():
+    """Test importing the module and handling run data does not load Plotly."""
+    code = ("import sys\n"
+            "from src.utils.visualization import PerformanceVisualizer\n"
+            "PerformanceVisualizer('unused').list_available_runs()\n"
+            "assert 'plotly' not in sys.modules\n")
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    subprocess.run([sys.executable, '-c', code], cwd=root, check=True)
+
+def test_report_session_shares_fresh_timestamp(visualizer):
+    """Test files written in a report session share one fresh timestamp."""
+    visualizer._run_timestamp = '20000101_000000'
+    with visualizer.report_session() as timestamp:
+        assert timestamp != '20000101_000000'
+        chart_file = visualizer.plot_memory_usage([100, 500], [1.0, 2.0])
+        page_file = visualizer.render_batch([('Memory', visualizer._chart_figures[chart_file])])
+    assert f'_{timestamp}_' in chart_file
+    assert f'_{timestamp}_' in page_file
+    assert visualizer._now() == '20000101_000000'
+
+def test_test_results_section(visualizer):
+    """Test the results summary shows counts and a colored success rate."""
+    html = visualizer._generate_test_results_section(
+        {'test_results': {'tests_run': 10, 'failures': 2, 'errors': 1}})
+    assert 'Tests Run:</strong> 10' in html
+    assert 'Errors:</strong> 1' in html
+    assert '<span style="color: #ffbb33">80.0%</span>' in html
+    assert visualizer._generate_test_results_section({}) == ''
+
+def test_atomic_write_keeps_old_file_on_failure(tmp_path):
+    """Test a failed write leaves the previous file and no temporary file."""
+    path = str(tmp_path / 'report.html')
+    with visualization._atomic_write(path) as f:
+        f.write('complete')
+    with pytest.raises(RuntimeError):
+        with visualization._atomic_write(path) as f:
+            f.write('partial')
+            raise RuntimeError('interrupted')
+    with open(path, encoding='utf-8') as f:
+        assert f.read() == 'complete'
+    assert os.listdir(tmp_path) == ['report.html']
+
+def test_reuse_charts_skips_unchanged_inputs(tmp_path, monkeypatch):
+    """Test charts named by input hash are reused until their inputs change."""
+    visualizer = PerformanceVisualizer(output_dir=str(tmp_path), reuse_charts=True)
+    first = visualizer.plot_memory_usage([100, 500], [1.0, 2.0])
+    changed = visualizer.plot_memory_usage([100, 500], [1.0, 3.0])
+    assert changed != first and os.path.exists(changed)
+    monkeypatch.setattr(visualizer, '_write_chart', lambda *args, **kwargs: pytest.fail('rebuilt'))
+    assert visualizer.plot_memory_usage(np.array([100, 500]), [1, 2]) == first
+
+def test_compressed_report(visualizer):
+    """Test compressed reports are gzipped HTML with collapsed CSS."""
+    report_file = visualizer.generate_html_report({}, [], compress=True)
+    assert report_file.endswith('.html.gz')
+    with gzip.open(report_file, 'rt', encoding='utf-8') as f:
+        html = f.read()
+    assert '<!DOCTYPE html>' in html
+    assert '.progress-container { width: 100%; margin: 10px 0; display: none; }' in html
+
+def test_report_releases_chart_figures(visualizer):
+    """Test figures are inlined into the report and then dropped from the registry."""
+    chart_file = visualizer.plot_memory_usage([100, 500], [10.0, 20.0])
+    report_file = visualizer.generate_html_report({}, [chart_file])
+    assert visualizer._chart_figures == {}
+    with open(report_file, encoding='utf-8') as f:
+        assert '<div id="chart_0" class="chart lazy-chart"></div>' in f.read()
@@ -1,7 +1,6 @@
 import pytest
 from PyQt6.QtCore import Qt, QDateTime
 from PyQt6.QtGui import QVector3D
-from PyQt6.QtWidgets import QApplication
 import numpy as np
 from src.core.scene import SceneManager
 from transform_tab import TransformTab
@@ -9,9 +8,9 @@ from viewport import Viewport
 from shapes_3d import Cube, Sphere
 
 @pytest.fixture
-def app():
-    """Create QApplication instance for tests."""
-    return QApplication([])
+def app(qapp):
+    """Get the QApplication shared by the whole test session."""
+    return qapp
 
 @pytest.fixture
 def transform_tab(app):
@@ -1,7 +1,6 @@
 import pytest
 import time
 import numpy as np
-from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt
 from PyQt6.QtTest import QTest
 import psutil
@@ -15,9 +14,9 @@ import unittest
 from ..core.transform import Transform
 
 @pytest.fixture
-def app():
-    """Create QApplication instance for tests."""
-    return QApplication([])
+def app(qapp):
+    """Get the QApplication shared by the whole test session."""
+    return qapp
 
 @pytest.fixture
 def transform_tab(app):
@@ -1,7 +1,6 @@
 import pytest
 from PyQt6.QtCore import Qt, QDateTime
 from PyQt6.QtTest import QTest
-from PyQt6.QtWidgets import QApplication
 import numpy as np
 from transform_tab import TransformTab
 from viewport import Viewport
@@ -11,9 +10,9 @@ import time
 import gc
 
 @pytest.fixture
-def app():
-    """Create QApplication instance for tests."""
-    return QApplication([])
+def app(qapp):
+    """Get the QApplication shared by the whole test session."""
+    return qapp
 
 @pytest.fixture
 def transform_tab(app):
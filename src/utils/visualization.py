@@ -1,41 +1,782 @@
-import plotly.graph_objs as go
-import plotly.io as pio
-from plotly.subplots import make_subplots
 import numpy as np
-from datetime import datetime
+import time
+import functools
+import gzip
+import io
+import re
+import types
 import os
 import json
+import base64
+import contextlib
+import hashlib
+import heapq
+import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import logging
-from typing import List, Dict, Union, Optional
+from typing import List, Dict, Tuple, Union, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import plotly.graph_objs as go
+
+try:
+    import orjson
+except ImportError:  # optional, speeds up encoding of large data series
+    orjson = None
+
+# HTML fragment templates for report sections
+_CHART_TMPL = '<div class="visualization"><h3>%s</h3><div class="lazy-chart" data-src="%s"></div></div>'
+_INLINE_CHART_TMPL = '<div class="visualization"><h3>%s</h3><div id="%s" class="chart lazy-chart"></div></div>'
+_CHART_SCRIPT_TMPL = """
+            const chartSpecs = {%s};
+            const chartConfig = {displayModeBar: true, responsive: true};
+
+            function renderChart(id) {
+                const spec = chartSpecs[id];
+                return Plotly.react(id, spec.data, spec.layout, chartConfig);
+            }
+
+            // Charts are only rendered (or their files fetched) once they
+            // scroll into view
+            function loadChart(el) {
+                el.classList.add('loaded');
+                if (el.dataset.src) {
+                    const frame = document.createElement('iframe');
+                    frame.src = el.dataset.src;
+                    el.appendChild(frame);
+                } else if (chartSpecs[el.id]) {
+                    renderChart(el.id);
+                }
+            }
+
+            const lazyCharts = document.querySelectorAll('.lazy-chart');
+            if ('IntersectionObserver' in window) {
+                const chartObserver = new IntersectionObserver((entries, obs) => {
+                    entries.forEach(entry => {
+                        if (entry.isIntersecting) {
+                            obs.unobserve(entry.target);
+                            loadChart(entry.target);
+                        }
+                    });
+                }, {rootMargin: '200px 0px'});
+                lazyCharts.forEach(el => chartObserver.observe(el));
+            } else {
+                lazyCharts.forEach(loadChart);
+            }
+"""
+# Script run after each duration chart renders: exposes the plotted data
+# for export and shows validation messages below the chart
+# Series are shipped as base64 little-endian float64 buffers and decoded
+# back into plain arrays
+_SERIES_JS_TMPL = '{shape_counts: b64ToF64("%s"), durations: b64ToF64("%s")}'
+_COMPARISON_JS_TMPL = '{current: window.currentData, comparison: %s}'
+_DURATION_JS_TMPL = """
+                function b64ToF64(encoded) {
+                    const bytes = atob(encoded);
+                    const buffer = new Uint8Array(bytes.length);
+                    for (let i = 0; i < bytes.length; i++) {
+                        buffer[i] = bytes.charCodeAt(i);
+                    }
+                    return Array.from(new Float64Array(buffer.buffer));
+                }
+                
+                window.currentData = %(current)s;
+                window.comparisonData = %(comparison)s;
+                window.validationSummary = %(validation)s;
+                
+                const validationStyle = document.createElement('style');
+                validationStyle.textContent = %(css)s;
+                document.head.appendChild(validationStyle);
+                
+                const validationMessages = document.createElement('div');
+                validationMessages.innerHTML = %(html)s;
+                document.body.appendChild(validationMessages);
+"""
+_VALIDATION_CSS = """
+                .validation-errors, .validation-warnings {
+                    margin: 10px 0;
+                    padding: 10px;
+                    border-radius: 4px;
+                }
+                .validation-errors {
+                    background-color: #ffebee;
+                    border: 1px solid #ffcdd2;
+                }
+                .validation-warnings {
+                    background-color: #fff3e0;
+                    border: 1px solid #ffe0b2;
+                }
+                .error-message {
+                    color: #c62828;
+                    margin: 5px 0;
+                }
+                .warning-message {
+                    color: #ef6c00;
+                    margin: 5px 0;
+                }
+"""
+
+# Plotly config for standalone chart files, and the buffer size chart and
+# report files are written with
+_CHART_CONFIG = {'displayModeBar': True, 'responsive': True}
+_DURATION_CHART_CONFIG = dict(
+    _CHART_CONFIG,
+    modeBarButtonsToAdd=['drawline', 'drawopenpath', 'eraseshape']
+)
+_WRITE_BUFFER = 1 << 20
+
+# plotly.js bundle shared by every chart and report, relative to output_dir
+_PLOTLYJS_PATH_TMPL = 'assets/plotly-%s.min.js'
+
+# Page shell for render_batch
+_BATCH_HEAD_TMPL = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>%s</title>
+    <script charset="utf-8" src="%s"></script>
+    <style>.lazy-chart { min-height: 450px; }</style>
+</head>
+<body>
+"""
+_BATCH_TAIL = """
+</body>
+</html>
+"""
+_COMP_BUTTONS_HTML = """
+                        <div class="button-group mt-2">
+                            <button onclick="exportComparisonData('csv')" class="btn btn-secondary">Export Comparison as CSV</button>
+                            <button onclick="exportComparisonData('json')" class="btn btn-secondary">Export Comparison as JSON</button>
+                            <button onclick="exportComparisonData('excel')" class="btn btn-secondary">Export Comparison as Excel</button>
+                        </div>"""
+_TEST_RESULTS_TMPL = """<div class="test-results mb-4">
+                        <h3>Test Results</h3>
+                        <p><strong>Tests Run:</strong> %d</p>
+                        <p><strong>Failures:</strong> %d</p>
+                        <p><strong>Errors:</strong> %d</p>
+                        <p><strong>Success Rate:</strong> <span style="color: %s">%.1f%%</span></p>
+                    </div>"""
+_REC_TMPL = '<div class="recommendation %s"><h4>%s</h4><p>%s</p></div>'
+_SYS_ITEM_TMPL = '<li><strong>%s:</strong> %s</li>'
+_SYS_LIST_OPEN = "<ul style='list-style-type: none; padding: 0;'>"
+_SYS_LIST_CLOSE = '</ul>'
+_KEY_TRANSLATION = str.maketrans({'_': ' '})
+
+# Static parts of the HTML report. Only the plotly.js path and the
+# per-report sections are filled in when a report is written. The CSS is
+# whitespace-collapsed once here; the JS keeps its line breaks since it
+# has // comments.
+_CSS_STATIC = """
+            .progress-container {
+                width: 100%;
+                margin: 10px 0;
+                display: none;
+            }
+            .progress-bar {
+                width: 0%;
+                height: 4px;
+                background-color: #4CAF50;
+                transition: width 0.3s ease-in-out;
+            }
+            .status-message {
+                margin: 5px 0;
+                padding: 8px;
+                border-radius: 4px;
+                display: none;
+            }
+            .status-success {
+                background-color: #E8F5E9;
+                color: #2E7D32;
+                border: 1px solid #A5D6A7;
+            }
+            .status-error {
+                background-color: #FFEBEE;
+                color: #C62828;
+                border: 1px solid #FFCDD2;
+            }
+            .status-warning {
+                background-color: #FFF3E0;
+                color: #EF6C00;
+                border: 1px solid #FFE0B2;
+            }
+            .status-info {
+                background-color: #E3F2FD;
+                color: #1565C0;
+                border: 1px solid #90CAF9;
+            }
+            .lazy-chart {
+                min-height: 450px;
+                border-radius: 4px;
+                background: linear-gradient(90deg, #f2f2f2 25%, #e6e6e6 50%, #f2f2f2 75%);
+                background-size: 200% 100%;
+                animation: chart-skeleton 1.5s ease-in-out infinite;
+            }
+            .lazy-chart.loaded {
+                background: none;
+                animation: none;
+            }
+            .lazy-chart iframe {
+                width: 100%;
+                height: 450px;
+                border: none;
+            }
+            @keyframes chart-skeleton {
+                from { background-position: 200% 0; }
+                to { background-position: -200% 0; }
+            }
+        """
+_CSS_STATIC = re.sub(r'\s+', ' ', _CSS_STATIC).strip()
+_JS_STATIC = """
+            function showProgress(show = true) {
+                document.querySelector('.progress-container').style.display = show ? 'block' : 'none';
+            }
+
+            function updateProgress(percent) {
+                document.querySelector('.progress-bar').style.width = `${percent}%`;
+            }
+
+            function showStatus(message, type = 'info') {
+                const statusEl = document.querySelector('.status-message');
+                statusEl.textContent = message;
+                statusEl.className = `status-message status-${type}`;
+                statusEl.style.display = 'block';
+                
+                // Auto-hide success messages after 3 seconds
+                if (type === 'success') {
+                    setTimeout(() => {
+                        statusEl.style.display = 'none';
+                    }, 3000);
+                }
+            }
+
+            function csvField(value) {
+                // Quote fields holding separators, quotes or line breaks
+                const text = String(value);
+                return /[",\\r\\n]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text;
+            }
+
+            function csvEncode(columns, headers) {
+                // Encode equal-length columns as CSV straight into one byte
+                // buffer, doubling it when full, instead of building the
+                // whole file as a string first
+                const encoder = new TextEncoder();
+                let buf = new Uint8Array(1 << 16);
+                let offset = 0;
+                const write = (text) => {
+                    for (;;) {
+                        const { read, written } = encoder.encodeInto(text, buf.subarray(offset));
+                        offset += written;
+                        if (read === text.length) {
+                            return;
+                        }
+                        text = text.slice(read);
+                        const grown = new Uint8Array(buf.length * 2);
+                        grown.set(buf.subarray(0, offset));
+                        buf = grown;
+                    }
+                };
+                write(headers.map(csvField).join(',') + '\\n');
+                const n = columns.length ? columns[0].length : 0;
+                for (let i = 0; i < n; i++) {
+                    write(columns.map(column => csvField(column[i])).join(',') + '\\n');
+                }
+                return buf.subarray(0, offset);
+            }
+
+            function downloadParts(parts, filename, format) {
+                const blob = new Blob(parts, { type: getMimeType(format) });
+                const url = URL.createObjectURL(blob);
+                const a = document.createElement('a');
+                a.href = url;
+                a.download = filename;
+                document.body.appendChild(a);
+                a.click();
+                document.body.removeChild(a);
+                URL.revokeObjectURL(url);
+            }
+
+            async function exportData(format) {
+                showProgress();
+                showStatus('Preparing data for export...', 'info');
+                
+                try {
+                    // Validate data
+                    updateProgress(20);
+                    const validationResult = validateDataArrays(window.currentData.shape_counts, window.currentData.durations);
+                    if (!validationResult.isValid) {
+                        throw new Error(validationResult.error);
+                    }
+                    
+                    // Sanitize data
+                    updateProgress(40);
+                    const sanitizedData = sanitizeDataForExport(window.currentData);
+                    
+                    // Format data
+                    updateProgress(60);
+                    let exportContent;
+                    let filename;
+                    const timestamp = new Date().toISOString().slice(0,19).replace(/[:-]/g, '');
+                    
+                    switch(format) {
+                        case 'csv':
+                            exportContent = csvEncode(
+                                [sanitizedData.shape_counts, sanitizedData.durations],
+                                ['shape_count', 'duration_ms']);
+                            filename = `performance_data_${timestamp}.csv`;
+                            break;
+                        case 'json':
+                            exportContent = formatJSON(sanitizedData);
+                            filename = `performance_data_${timestamp}.json`;
+                            break;
+                        case 'excel':
+                            exportContent = formatExcel(sanitizedData);
+                            filename = `performance_data_${timestamp}.xls`;
+                            break;
+                        default:
+                            throw new Error(`Unsupported format: ${format}`);
+                    }
+                    
+                    // Create and trigger download
+                    updateProgress(80);
+                    downloadParts([exportContent], filename, format);
+                    
+                    updateProgress(100);
+                    showStatus(`Data exported successfully as ${format.toUpperCase()}`, 'success');
+                } catch (error) {
+                    showStatus(error.message, 'error');
+                } finally {
+                    setTimeout(() => {
+                        showProgress(false);
+                        updateProgress(0);
+                    }, 1000);
+                }
+            }
+
+            async function exportComparisonData(format) {
+                showProgress();
+                showStatus('Preparing comparison data for export...', 'info');
+                
+                try {
+                    // Validate both datasets
+                    updateProgress(20);
+                    const currentValidation = validateDataArrays(window.currentData.shape_counts, window.currentData.durations);
+                    const comparisonValidation = validateDataArrays(window.comparisonData.shape_counts, window.comparisonData.durations);
+                    
+                    if (!currentValidation.isValid || !comparisonValidation.isValid) {
+                        throw new Error('Invalid data in current or comparison dataset');
+                    }
+                    
+                    // Validate matching shape counts
+                    if (!arraysMatch(window.currentData.shape_counts, window.comparisonData.shape_counts)) {
+                        throw new Error('Shape counts in current and comparison data do not match');
+                    }
+                    
+                    // Sanitize both datasets
+                    updateProgress(40);
+                    const sanitizedCurrent = sanitizeDataForExport(window.currentData);
+                    const sanitizedComparison = sanitizeDataForExport(window.comparisonData);
+                    
+                    // Format data
+                    updateProgress(60);
+                    let exportParts;
+                    let filename;
+                    const timestamp = new Date().toISOString().slice(0,19).replace(/[:-]/g, '');
+                    
+                    switch(format) {
+                        case 'csv':
+                            exportParts = [csvEncode(
+                                [sanitizedCurrent.shape_counts, sanitizedCurrent.durations, sanitizedComparison.durations],
+                                ['shape_count', 'current_duration_ms', 'comparison_duration_ms'])];
+                            filename = `comparison_data_${timestamp}.csv`;
+                            break;
+                        case 'json':
+                            exportParts = [formatComparisonJSON(sanitizedCurrent, sanitizedComparison)];
+                            filename = `comparison_data_${timestamp}.json`;
+                            break;
+                        case 'excel':
+                            exportParts = [formatComparisonExcel(sanitizedCurrent, sanitizedComparison)];
+                            filename = `comparison_data_${timestamp}.xls`;
+                            break;
+                        default:
+                            throw new Error(`Unsupported format: ${format}`);
+                    }
+                    
+                    // Create and trigger download
+                    updateProgress(80);
+                    downloadParts(exportParts, filename, format);
+                    
+                    updateProgress(100);
+                    showStatus(`Comparison data exported successfully as ${format.toUpperCase()}`, 'success');
+                } catch (error) {
+                    showStatus(error.message, 'error');
+                } finally {
+                    setTimeout(() => {
+                        showProgress(false);
+                        updateProgress(0);
+                    }, 1000);
+                }
+            }
+        """
+_HTML_HEAD_TMPL = """
+            <!DOCTYPE html>
+            <html>
+            <head>
+                <title>Performance Test Report</title>
+                <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
+                <script charset="utf-8" src="%s"></script>
+                <style>"""
+_HTML_PREFIX = _CSS_STATIC + """</style>
+            </head>
+            <body>
+                <div class="container mt-4">
+                    <h1 class="mb-4">Performance Test Report</h1>
+                    
+                    <!-- Progress and Status -->
+                    <div class="progress-container">
+                        <div class="progress-bar"></div>
+                    </div>
+                    <div class="status-message"></div>
+                    
+                    <!-- Export Controls -->
+                    <div class="export-controls mb-4">
+                        <h3>Export Options</h3>
+                        <div class="button-group">
+                            <button onclick="exportData('csv')" class="btn btn-primary">Export as CSV</button>
+                            <button onclick="exportData('json')" class="btn btn-primary">Export as JSON</button>
+                            <button onclick="exportData('excel')" class="btn btn-primary">Export as Excel</button>
+                        </div>
+                        """
+_HTML_SCRIPTS_OPEN = """
+                </div>
+                
+                <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
+                <script>""" + _JS_STATIC + "</script>\n                <script>"
+_HTML_SUFFIX = """</script>
+            </body>
+            </html>
+        """
+
+# Trace colors and hover templates
+_COLOR_LINE = '#1f77b4'
+_COLOR_TREND = '#ff7f0e'
+_COLOR_MEMORY = '#2ecc71'
+_COLOR_POINTS = '#3498db'
+_COLOR_POINTS_EDGE = '#2980b9'
+_COLOR_SCATTER_TREND = '#e74c3c'
+_HOVER_DUR = 'Shape Count: %{x}<br>Duration: %{y:.2f} ms<extra></extra>'
+_HOVER_TREND = 'Shape Count: %{x}<br>Predicted: %{y:.2f} ms<extra></extra>'
+_HOVER_MEMORY = 'Shape Count: %{x}<br>Memory: %{y:.1f} MB<extra></extra>'
+_HOVER_SCATTER_TMPL = '%s: %%{x}<br>%s: %%{y:.2f}<extra></extra>'
+_HOVER_SCATTER_TREND_TMPL = '%s: %%{x}<br>Predicted %s: %%{y:.2f}<extra></extra>'
+
+# Layout shared by every chart, registered once as the "perf" template so
+# plot methods only pass what differs per chart
+_BASE_LAYOUT = dict(
+    title=dict(x=0.5, font=dict(size=20)),
+    xaxis=dict(title=dict(font=dict(size=14))),
+    yaxis=dict(title=dict(font=dict(size=14))),
+    hovermode='closest',
+    showlegend=True,
+    legend=dict(yanchor="top", y=0.99, xanchor="right", x=0.99),
+    margin=dict(t=100, l=80, r=80, b=80)
+)
+
+@functools.cache
+def _plotly():
+    """Import and configure Plotly on first use.
+
+    Plotly takes a noticeable while to import, so it is only loaded once a
+    chart is built; saving, loading and listing runs never pay for it. The
+    "perf" template is registered here and made the default, and figures
+    are encoded with orjson when it is available.
+    """
+    import plotly.graph_objs as go
+    import plotly.io as pio
+    from plotly.subplots import make_subplots
+    from plotly.offline import get_plotlyjs, get_plotlyjs_version
+    
+    pio.templates['perf'] = go.layout.Template(layout=_BASE_LAYOUT)
+    pio.templates.default = "plotly_white+perf"
+    if orjson is not None:
+        pio.json.config.default_engine = 'orjson'
+    return types.SimpleNamespace(
+        go=go, make_subplots=make_subplots, get_plotlyjs=get_plotlyjs,
+        plotlyjs_path=_PLOTLYJS_PATH_TMPL % get_plotlyjs_version())
+
+def _js_string(text: str) -> str:
+    """Quote text as a JavaScript string literal safe to embed in <script>."""
+    return json.dumps(text).replace('</', '<\\/')
+
+_VALIDATION_CSS_JS = _js_string(_VALIDATION_CSS)
+
+def _numpy_default(obj):
+    """Convert NumPy arrays and scalars for the stdlib JSON encoder."""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _chart_script(specs) -> str:
+    """Build the script rendering (div_id, figure) pairs into their placeholders."""
+    return _CHART_SCRIPT_TMPL % ', '.join(f'"{div_id}": {fig.to_json()}' for div_id, fig in specs)
+
+def dump_json(obj, indent: bool = False) -> bytes:
+    """Serialize test data to JSON bytes.
+    
+    orjson output is indented since it costs next to nothing there; the
+    stdlib fallback writes compact JSON, as pretty-printing is much slower,
+    unless indent asks for a human-readable file.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                            | orjson.OPT_NON_STR_KEYS)
+    if indent:
+        return json.dumps(obj, indent=2, default=_numpy_default).encode()
+    return json.dumps(obj, separators=(',', ':'), default=_numpy_default).encode()
+
+@contextlib.contextmanager
+def _atomic_write(path: str, binary: bool = False):
+    """Open a file for writing that only replaces path once fully written.
+    
+    Data goes to a temporary file next to path, which is fsynced and then
+    renamed over path, so a crash never leaves a truncated file behind.
+    """
+    tmp = path + '.tmp'
+    if binary:
+        f = open(tmp, 'wb', buffering=_WRITE_BUFFER)
+    else:
+        f = open(tmp, 'w', encoding='utf-8', buffering=_WRITE_BUFFER)
+    try:
+        with f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        os.remove(tmp)
+        raise
+    os.replace(tmp, path)
+
+def _load_json(data: bytes):
+    """Deserialize JSON bytes written by dump_json."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _content_key(*inputs) -> str:
+    """Hash chart inputs into a short key for naming reusable chart files.
+    
+    Number lists and arrays are hashed by their float64 values, dicts by
+    their items and anything else by its repr.
+    """
+    h = hashlib.blake2b(digest_size=8)
+    def feed(value):
+        if isinstance(value, dict):
+            h.update(b'{%d' % len(value))
+            for key in sorted(value, key=str):
+                h.update(repr(key).encode())
+                feed(value[key])
+        elif isinstance(value, (list, np.ndarray)):
+            arr = np.ascontiguousarray(value, dtype=np.float64)
+            h.update(b'[%d' % arr.size)
+            h.update(arr.tobytes())
+        else:
+            h.update(repr(value).encode())
+        h.update(b'\0')
+    for value in inputs:
+        feed(value)
+    return h.hexdigest()
+
+def _ndarray_to_b64(values) -> str:
+    """Encode a data series as base64 of its little-endian float64 bytes."""
+    return base64.b64encode(np.asarray(values, dtype='<f8').tobytes()).decode('ascii')
+
+def _linfit(x, y):
+    """Fit a least-squares line to a series, returning (slope, intercept)."""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    mx = x.mean()
+    my = y.mean()
+    dx = x - mx
+    slope = (dx @ (y - my)) / (dx @ dx)
+    return slope, my - slope * mx
+
+# Saved runs are stored as <data_dir>/test_data_<run_id>.json
+_RUN_PREFIX = 'test_data_'
+_RUN_SUFFIX = '.json'
+_RUN_PREFIX_LEN = len(_RUN_PREFIX)
+_RUN_SUFFIX_LEN = len(_RUN_SUFFIX)
+
+# strftime format of run timestamps and default run IDs
+_STAMP_FORMAT = '%Y%m%d_%H%M%S'
+
+# Validation errors kept across runs for get_validation_summary
+_MAX_STORED_ERRORS = 1000
+
+# Maximum number of offending indices reported per check in _check_series
+_MAX_INDEX_ERRORS = 10
+
+def _check_series(values, name: str, label: str) -> List[str]:
+    """Check a data series for non-numeric, negative and NaN/Inf values.
+    
+    Numeric sequences are checked with vectorized masks. Anything NumPy
+    cannot turn into a plain numeric array falls back to type-checking
+    each element. Each check reports at most _MAX_INDEX_ERRORS indices.
+    """
+    non_numeric = None
+    try:
+        arr = np.asarray(values)
+    except (TypeError, ValueError):
+        arr = None
+    if arr is not None and arr.ndim == 1 and arr.dtype.kind in 'biuf':
+        arr = arr.astype(np.float64, copy=False)
+    else:
+        numeric = np.fromiter((isinstance(v, (int, float)) for v in values),
+                              dtype=bool, count=len(values))
+        arr = np.array([float(v) if ok else 0.0 for v, ok in zip(values, numeric)])
+        non_numeric = ~numeric
+    
+    errors = []
+    checks = [
+        (non_numeric, lambda i: f"Non-numeric value found in {name} at index {i}: {values[i]}"),
+        (arr < 0, lambda i: f"Negative {label} found at index {i}: {values[i]}"),
+        (~np.isfinite(arr), lambda i: f"Invalid {label} (NaN/Inf) found at index {i}")
+    ]
+    for mask, message in checks:
+        if mask is None or not mask.any():
+            continue
+        bad = np.flatnonzero(mask)
+        errors.extend(message(i) for i in bad[:_MAX_INDEX_ERRORS])
+        if len(bad) > _MAX_INDEX_ERRORS:
+            errors.append(f"... and {len(bad) - _MAX_INDEX_ERRORS} more")
+    return errors
+
+# Series longer than this are drawn with WebGL rather than SVG. Smaller
+# charts stay on SVG, so a report full of charts does not run into the
+# browser's limit on live WebGL contexts.
+_WEBGL_THRESHOLD = 5000
+
+def _scatter_cls(n_points: int):
+    """Pick the scatter trace type for a series of n_points."""
+    go = _plotly().go
+    return go.Scattergl if n_points > _WEBGL_THRESHOLD else go.Scatter
+
+def _can_fit_line(x) -> bool:
+    """Check whether a series spans enough distinct x values to fit a line."""
+    return len(x) >= 2 and np.ptp(x) > 0
+
+def _lttb(x, y, n_out=2000):
+    """Downsample a series with Largest-Triangle-Three-Buckets.
+
+    Keeps the first and last points and, from each of the ``n_out - 2``
+    buckets in between, the point forming the largest triangle with the
+    previously kept point and the mean of the next bucket. Buckets are
+    taken along x, so unsorted points are sorted by x first.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return x, y
+    if np.any(x[1:] < x[:-1]):
+        order = np.argsort(x, kind='stable')
+        x, y = x[order], y[order]
+    
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    kept = np.empty(n_out, dtype=np.intp)
+    kept[0], kept[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_x = x[end:edges[i + 2]].mean()
+            next_y = y[end:edges[i + 2]].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+        area = np.abs((x[a] - next_x) * (y[start:end] - y[a])
+                      - (x[a] - x[start:end]) * (next_y - y[a]))
+        a = start + int(np.argmax(area))
+        kept[i + 1] = a
+    return x[kept], y[kept]
 
 class PerformanceVisualizer:
     """Generates interactive visualizations for performance test results."""
     
-    def __init__(self, output_dir='reports'):
-        """Initialize visualizer with output directory."""
+    def __init__(self, output_dir='reports', reuse_charts=False):
+        """Initialize visualizer with output directory.
+        
+        With reuse_charts, chart files are named by a hash of their inputs
+        rather than a timestamp, and a chart whose file already exists is
+        returned without being rebuilt.
+        """
         self.output_dir = output_dir
         self.data_dir = os.path.join(output_dir, 'data')
         self.export_dir = os.path.join(output_dir, 'exports')
-        os.makedirs(output_dir, exist_ok=True)
-        os.makedirs(self.data_dir, exist_ok=True)
-        os.makedirs(self.export_dir, exist_ok=True)
+        self.reuse_charts = reuse_charts
         
-        # Set default Plotly template
-        pio.templates.default = "plotly_white"
+        # Directories known to exist; each is created on first write into it
+        self._created = set()
         
         # Configure logging
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
         
+        # Figures drawn since the last report, keyed by chart filename, so
+        # the next report can render them inline instead of loading each
+        # chart file; generate_html_report clears it
+        self._chart_figures = {}
+        
+        # Previously saved runs already read back from disk, keyed by run ID
+        self._loaded_runs = {}
+        
+        # Scatter hover templates, keyed by (x_label, y_label)
+        self._hover_cache = {}
+        
+        # Timestamp shared by every file written during this run, plus a
+        # counter that keeps filenames unique within the run
+        self._run_timestamp = None
+        self._file_counter = itertools.count(1)
+        
         # Initialize validation stats
         self.validation_stats = {
             'total_validations': 0,
             'failed_validations': 0,
-            'validation_errors': []
+            'validation_errors': deque(maxlen=_MAX_STORED_ERRORS)
         }
+        
+        # (stats key, JSON) of the last encoded validation summary
+        self._summary_cache = None
+    
+    def _now(self) -> str:
+        """Get the timestamp for this run, computing it on first use."""
+        if self._run_timestamp is None:
+            self._run_timestamp = time.strftime(_STAMP_FORMAT)
+        return self._run_timestamp
+    
+    @contextlib.contextmanager
+    def report_session(self):
+        """Stamp every file written inside the block with one fresh timestamp.
+        
+        Charts and the report built together then share a timestamp, even on
+        a long-lived visualizer whose run timestamp was taken much earlier.
+        Yields the timestamp; the run timestamp is restored afterwards.
+        """
+        previous = self._run_timestamp
+        self._run_timestamp = time.strftime(_STAMP_FORMAT)
+        try:
+            yield self._run_timestamp
+        finally:
+            self._run_timestamp = previous
+    
+    def _file_stamp(self, timestamp: Optional[str] = None) -> str:
+        """Get a unique filename stamp for the next file written this run.
+        
+        A caller-supplied timestamp replaces the run timestamp, so related
+        files can be grouped under a stamp of the caller's choosing.
+        """
+        return f'{timestamp or self._now()}_{next(self._file_counter)}'
     
     def _validate_data(self, shape_counts: List[int], durations: List[float], 
-                      test_type: str = 'batch') -> Dict[str, List[str]]:
+                      test_type: str = 'batch', cache: Optional[Dict] = None) -> Dict[str, List[str]]:
         """Validate input data for visualization."""
         errors = []
         warnings = []
@@ -50,29 +791,25 @@ class PerformanceVisualizer:
             errors.append(f"Array length mismatch: shape_counts ({len(shape_counts)}) != durations ({len(durations)})")
             return {'errors': errors, 'warnings': warnings}
         
-        # Validate numeric values
-        for i, (count, duration) in enumerate(zip(shape_counts, durations)):
-            # Check for non-numeric values
-            if not isinstance(count, (int, float)):
-                errors.append(f"Non-numeric value found in shape_counts at index {i}: {count}")
-            if not isinstance(duration, (int, float)):
-                errors.append(f"Non-numeric value found in durations at index {i}: {duration}")
+        # Within one plot call (the caller's cache) a series that was already
+        # validated is not checked again; the caller keeps it alive and
+        # unchanged for the duration of the call
+        key = (id(shape_counts), id(durations))
+        cached = cache.get(key) if cache is not None else None
+        if cached is not None:
+            errors.extend(cached[0])
+            warnings.extend(cached[1])
+        else:
+            # Validate numeric values
+            errors.extend(_check_series(shape_counts, 'shape_counts', 'shape count'))
+            errors.extend(_check_series(durations, 'durations', 'duration'))
             
-            # Check for negative values
-            if isinstance(count, (int, float)) and count < 0:
-                errors.append(f"Negative shape count found at index {i}: {count}")
-            if isinstance(duration, (int, float)) and duration < 0:
-                errors.append(f"Negative duration found at index {i}: {duration}")
+            # Performance warnings
+            if len(shape_counts) > 1000:
+                warnings.append(f"Large dataset detected ({len(shape_counts)} points). This may impact visualization performance.")
             
-            # Check for NaN or Inf values
-            if isinstance(count, float) and (np.isnan(count) or np.isinf(count)):
-                errors.append(f"Invalid shape count (NaN/Inf) found at index {i}")
-            if isinstance(duration, float) and (np.isnan(duration) or np.isinf(duration)):
-                errors.append(f"Invalid duration (NaN/Inf) found at index {i}")
-        
-        # Performance warnings
-        if len(shape_counts) > 1000:
-            warnings.append(f"Large dataset detected ({len(shape_counts)} points). This may impact visualization performance.")
+            if cache is not None:
+                cache[key] = (tuple(errors), tuple(warnings))
         
         # Update validation stats
         self.validation_stats['total_validations'] += 1
@@ -82,7 +819,8 @@ class PerformanceVisualizer:
         
         return {'errors': errors, 'warnings': warnings}
     
-    def _validate_comparison_data(self, current_data: Dict, comparison_data: Dict) -> Dict[str, List[str]]:
+    def _validate_comparison_data(self, current_data: Dict, comparison_data: Dict,
+                                  cache: Optional[Dict] = None) -> Dict[str, List[str]]:
         """Validate comparison data for visualization."""
         errors = []
         warnings = []
@@ -106,8 +844,8 @@ class PerformanceVisualizer:
         comp_durations = comparison_data['durations']
         
         # Validate each dataset
-        current_validation = self._validate_data(current_counts, current_durations)
-        comp_validation = self._validate_data(comp_counts, comp_durations)
+        current_validation = self._validate_data(current_counts, current_durations, cache=cache)
+        comp_validation = self._validate_data(comp_counts, comp_durations, cache=cache)
         
         errors.extend(current_validation['errors'])
         errors.extend(comp_validation['errors'])
@@ -120,77 +858,149 @@ class PerformanceVisualizer:
         
         # Check for significant differences
         if not errors and len(current_counts) == len(comp_counts):
-            count_diffs = np.array(current_counts) - np.array(comp_counts)
-            duration_diffs = np.array(current_durations) - np.array(comp_durations)
-            
-            if np.any(np.abs(count_diffs) > 0):
+            if not np.array_equal(current_counts, comp_counts):
                 warnings.append("Shape count differences detected between current and comparison data")
-            if np.any(np.abs(duration_diffs) > 1000):  # 1000ms threshold
+            
+            # One temporary for the differences, made absolute in place
+            duration_diffs = np.subtract(current_durations, comp_durations, dtype=np.float64)
+            np.abs(duration_diffs, out=duration_diffs)
+            if duration_diffs.size and duration_diffs.max() > 1000:  # 1000ms threshold
                 warnings.append("Significant duration differences detected (>1000ms)")
         
         return {'errors': errors, 'warnings': warnings}
     
     def get_validation_summary(self) -> Dict[str, Union[int, List[str]]]:
         """Get summary of validation statistics."""
+        errors = self.validation_stats['validation_errors']
         return {
             'total_validations': self.validation_stats['total_validations'],
             'failed_validations': self.validation_stats['failed_validations'],
             'error_rate': (self.validation_stats['failed_validations'] / 
                          max(1, self.validation_stats['total_validations'])),
-            'recent_errors': self.validation_stats['validation_errors'][-10:]  # Last 10 errors
+            'recent_errors': list(itertools.islice(reversed(errors), 10))[::-1]  # Last 10 errors
         }
     
+    def _summary_json(self) -> str:
+        """Get get_validation_summary() as JSON, re-encoding only after new validations."""
+        stats = self.validation_stats
+        # Every validation bumps the total, and errors are only recorded
+        # during one, so the counters identify the summary's contents
+        key = (stats['total_validations'], stats['failed_validations'])
+        if self._summary_cache is None or self._summary_cache[0] != key:
+            self._summary_cache = (key, json.dumps(self.get_validation_summary()))
+        return self._summary_cache[1]
+    
     def _format_validation_messages(self, validation_results: Dict[str, List[str]]) -> str:
         """Format validation messages for display."""
-        messages = []
+        errors = validation_results['errors']
+        warnings = validation_results['warnings']
+        if not errors and not warnings:
+            return ""
         
-        if validation_results['errors']:
-            messages.append("<div class='validation-errors'>")
-            messages.append("<h3>Validation Errors:</h3>")
-            messages.extend([f"<p class='error-message'>{error}</p>" 
-                           for error in validation_results['errors']])
+        messages = []
+        if errors:
+            messages.append("<div class='validation-errors'><h3>Validation Errors:</h3>")
+            messages.extend(f"<p class='error-message'>{error}</p>" for error in errors)
             messages.append("</div>")
         
-        if validation_results['warnings']:
-            messages.append("<div class='validation-warnings'>")
-            messages.append("<h3>Validation Warnings:</h3>")
-            messages.extend([f"<p class='warning-message'>{warning}</p>" 
-                           for warning in validation_results['warnings']])
+        if warnings:
+            messages.append("<div class='validation-warnings'><h3>Validation Warnings:</h3>")
+            messages.extend(f"<p class='warning-message'>{warning}</p>" for warning in warnings)
             messages.append("</div>")
         
-        return "\n".join(messages)
+        return "".join(messages)
+    
+    def _ensure(self, path: str) -> str:
+        """Create a directory the first time something is written into it."""
+        if path not in self._created:
+            if not os.path.isdir(path):
+                os.makedirs(path, exist_ok=True)
+            self._created.add(path)
+        return path
+    
+    def _plotlyjs_src(self) -> str:
+        """Get the shared plotly.js path, writing the bundle on first use."""
+        plotly = _plotly()
+        bundle = os.path.join(self.output_dir, plotly.plotlyjs_path)
+        if not os.path.exists(bundle):
+            self._ensure(os.path.dirname(bundle))
+            with _atomic_write(bundle) as f:
+                f.write(plotly.get_plotlyjs())
+        return plotly.plotlyjs_path
+    
+    def _chart_file(self, prefix, timestamp, *inputs):
+        """Get the filename for a chart, and whether that file can be reused."""
+        self._ensure(self.output_dir)
+        if self.reuse_charts:
+            filename = f'{self.output_dir}/{prefix}_{_content_key(*inputs)}.html'
+            if os.path.exists(filename):
+                self.logger.info(f"Reusing unchanged chart {filename}")
+                return filename, True
+            return filename, False
+        return f'{self.output_dir}/{prefix}_{self._file_stamp(timestamp)}.html', False
+    
+    def _write_chart(self, fig, filename, config=_CHART_CONFIG, post_script=None):
+        """Write a standalone chart file and register its figure for reports."""
+        with _atomic_write(filename) as f:
+            fig.write_html(
+                f,
+                include_plotlyjs=self._plotlyjs_src(),
+                full_html=True,
+                config=config,
+                post_script=post_script
+            )
+        self._chart_figures[filename] = fig
     
     def save_test_data(self, test_data, run_id=None):
         """Save test data for future comparisons."""
         if run_id is None:
-            run_id = datetime.now().strftime('%Y%m%d_%H%M%S')
+            run_id = time.strftime(_STAMP_FORMAT)
         
-        data_file = os.path.join(self.data_dir, f'test_data_{run_id}.json')
-        with open(data_file, 'w') as f:
-            json.dump(test_data, f, indent=2)
+        data_file = os.path.join(self._ensure(self.data_dir), f'{_RUN_PREFIX}{run_id}{_RUN_SUFFIX}')
+        with _atomic_write(data_file, binary=True) as f:
+            f.write(dump_json(test_data))
+        self._loaded_runs.pop(run_id, None)
         
         return run_id
     
     def load_test_data(self, run_id):
-        """Load test data from a previous run."""
-        data_file = os.path.join(self.data_dir, f'test_data_{run_id}.json')
-        with open(data_file, 'r') as f:
-            return json.load(f)
-    
-    def list_available_runs(self):
-        """List available test runs for comparison."""
-        runs = []
-        for file in os.listdir(self.data_dir):
-            if file.startswith('test_data_') and file.endswith('.json'):
-                run_id = file[10:-5]  # Remove 'test_data_' and '.json'
-                runs.append(run_id)
-        return sorted(runs, reverse=True)
+        """Load test data from a previous run.
+        
+        Runs are cached after the first load, so the returned data is shared
+        between callers and should not be modified.
+        """
+        if run_id not in self._loaded_runs:
+            data_file = os.path.join(self.data_dir, f'{_RUN_PREFIX}{run_id}{_RUN_SUFFIX}')
+            with open(data_file, 'rb') as f:
+                self._loaded_runs[run_id] = _load_json(f.read())
+        return self._loaded_runs[run_id]
+    
+    def list_available_runs(self, limit: Optional[int] = None):
+        """List available test runs for comparison, newest first.
+        
+        With a limit only the newest ``limit`` runs are returned, selected
+        without sorting the whole directory.
+        """
+        try:
+            with os.scandir(self.data_dir) as entries:
+                # Strip the file prefix and suffix to get the run ID
+                runs = (entry.name[_RUN_PREFIX_LEN:-_RUN_SUFFIX_LEN] for entry in entries
+                        if entry.name.startswith(_RUN_PREFIX) and entry.name.endswith(_RUN_SUFFIX)
+                        and entry.is_file())
+                if limit is not None:
+                    return heapq.nlargest(limit, runs)
+                return sorted(runs, reverse=True)
+        except FileNotFoundError:
+            return []  # nothing has been saved yet
     
     def plot_transform_durations(self, shape_counts, durations, test_type='batch', 
-                               comparison_data=None, filters=None):
+                               comparison_data=None, filters=None, timestamp=None):
         """Generate interactive line plot of transform durations vs shape count."""
-        # Validate input data
-        validation_results = self._validate_data(shape_counts, durations, test_type)
+        # Validate input data; the comparison check below reuses the result
+        # for the current series through this call's cache
+        validation_cache = {}
+        validation_results = self._validate_data(shape_counts, durations, test_type,
+                                                 cache=validation_cache)
         
         if validation_results['errors']:
             self.logger.error("Validation errors encountered:")
@@ -206,7 +1016,8 @@ class PerformanceVisualizer:
         if comparison_data:
             comp_validation = self._validate_comparison_data(
                 {'shape_counts': shape_counts, 'durations': durations},
-                comparison_data
+                comparison_data,
+                cache=validation_cache
             )
             if comp_validation['errors']:
                 self.logger.error("Comparison data validation errors:")
@@ -218,58 +1029,62 @@ class PerformanceVisualizer:
                 for warning in comp_validation['warnings']:
                     self.logger.warning(warning)
         
+        # From here on work on float64 arrays, which Plotly serializes as
+        # binary typed arrays instead of JSON number lists
+        shape_counts = np.asarray(shape_counts, dtype=np.float64)
+        durations = np.asarray(durations, dtype=np.float64)
+        
+        filename, reused = self._chart_file(f'transform_duration_{test_type}', timestamp,
+                                            shape_counts, durations, comparison_data, filters)
+        if reused:
+            return filename
+        
         # Apply filters if provided
+        all_shape_counts = shape_counts
         if filters:
             try:
-                filtered_indices = self._apply_filters(shape_counts, filters)
-                shape_counts = [shape_counts[i] for i in filtered_indices]
-                durations = [durations[i] for i in filtered_indices]
+                keep = self._apply_filters(shape_counts, filters)
+                shape_counts = shape_counts[keep]
+                durations = durations[keep]
                 
-                if not shape_counts:
+                if shape_counts.size == 0:
                     raise ValueError("No data points remain after applying filters")
             except Exception as e:
                 self.logger.error(f"Error applying filters: {str(e)}")
                 raise
         
         # Create figure based on comparison mode
+        plotly = _plotly()
         try:
             if comparison_data:
-                fig = make_subplots(rows=1, cols=2, 
+                fig = plotly.make_subplots(rows=1, cols=2, 
                                   subplot_titles=("Current Run", "Comparison Run"),
                                   horizontal_spacing=0.1)
                 
                 # Current run
-                self._add_duration_traces(fig, shape_counts, durations, row=1, col=1)
+                shape_counts, durations = self._add_duration_traces(
+                    fig, shape_counts, durations, row=1, col=1)
                 
                 # Comparison run
-                comp_shape_counts = comparison_data['shape_counts']
-                comp_durations = comparison_data['durations']
+                comp_shape_counts = np.asarray(comparison_data['shape_counts'], dtype=np.float64)
+                comp_durations = np.asarray(comparison_data['durations'], dtype=np.float64)
                 if filters:
-                    filtered_indices = self._apply_filters(comp_shape_counts, filters)
-                    comp_shape_counts = [comp_shape_counts[i] for i in filtered_indices]
-                    comp_durations = [comp_durations[i] for i in filtered_indices]
-                self._add_duration_traces(fig, comp_shape_counts, comp_durations, row=1, col=2)
+                    # Runs over the same shape counts share the current mask
+                    if not np.array_equal(all_shape_counts, comp_shape_counts):
+                        keep = self._apply_filters(comp_shape_counts, filters)
+                    comp_shape_counts = comp_shape_counts[keep]
+                    comp_durations = comp_durations[keep]
+                comp_shape_counts, comp_durations = self._add_duration_traces(
+                    fig, comp_shape_counts, comp_durations, row=1, col=2)
                 
                 fig.update_layout(height=600)
             else:
-                fig = go.Figure()
-                self._add_duration_traces(fig, shape_counts, durations)
+                fig = plotly.go.Figure()
+                shape_counts, durations = self._add_duration_traces(fig, shape_counts, durations)
             
             # Update layout
             fig.update_layout(
-                title=dict(
-                    text=f'{test_type.title()} Transform Duration vs Shape Count',
-                    x=0.5,
-                    font=dict(size=20)
-                ),
-                showlegend=True,
-                legend=dict(
-                    yanchor="top",
-                    y=0.99,
-                    xanchor="right",
-                    x=0.99
-                ),
-                margin=dict(t=100, l=80, r=80, b=80)
+                title_text=f'{test_type.title()} Transform Duration vs Shape Count'
             )
             
             # Add range slider for time series exploration
@@ -281,107 +1096,24 @@ class PerformanceVisualizer:
                 'warnings': validation_results['warnings']
             })
             
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f'{self.output_dir}/transform_duration_{test_type}_{timestamp}.html'
-            
-            # Prepare data for JavaScript
-            if comparison_data:
-                js_data = f"""
-                <script>
-                window.currentData = {{
-                    shape_counts: {json.dumps(shape_counts)},
-                    durations: {json.dumps(durations)}
-                }};
-                window.comparisonData = {{
-                    current: {{
-                        shape_counts: {json.dumps(shape_counts)},
-                        durations: {json.dumps(durations)}
-                    }},
-                    comparison: {{
-                        shape_counts: {json.dumps(comp_shape_counts)},
-                        durations: {json.dumps(comp_durations)}
-                    }}
-                }};
-                window.validationSummary = {json.dumps(self.get_validation_summary())};
-                </script>
-                
-                <style>
-                .validation-errors, .validation-warnings {{
-                    margin: 10px 0;
-                    padding: 10px;
-                    border-radius: 4px;
-                }}
-                .validation-errors {{
-                    background-color: #ffebee;
-                    border: 1px solid #ffcdd2;
-                }}
-                .validation-warnings {{
-                    background-color: #fff3e0;
-                    border: 1px solid #ffe0b2;
-                }}
-                .error-message {{
-                    color: #c62828;
-                    margin: 5px 0;
-                }}
-                .warning-message {{
-                    color: #ef6c00;
-                    margin: 5px 0;
-                }}
-                </style>
-                
-                {validation_html}
-                """
-            else:
-                js_data = f"""
-                <script>
-                window.currentData = {{
-                    shape_counts: {json.dumps(shape_counts)},
-                    durations: {json.dumps(durations)}
-                }};
-                window.comparisonData = null;
-                window.validationSummary = {json.dumps(self.get_validation_summary())};
-                </script>
-                
-                <style>
-                .validation-errors, .validation-warnings {{
-                    margin: 10px 0;
-                    padding: 10px;
-                    border-radius: 4px;
-                }}
-                .validation-errors {{
-                    background-color: #ffebee;
-                    border: 1px solid #ffcdd2;
-                }}
-                .validation-warnings {{
-                    background-color: #fff3e0;
-                    border: 1px solid #ffe0b2;
-                }}
-                .error-message {{
-                    color: #c62828;
-                    margin: 5px 0;
-                }}
-                .warning-message {{
-                    color: #ef6c00;
-                    margin: 5px 0;
-                }}
-                </style>
-                
-                {validation_html}
-                """
+            # Prepare the plotted data for JavaScript, encoding each series
+            # only once
+            current_js = _SERIES_JS_TMPL % (_ndarray_to_b64(shape_counts), _ndarray_to_b64(durations))
+            if comparison_data:
+                comparison_js = _COMPARISON_JS_TMPL % (
+                    _SERIES_JS_TMPL % (_ndarray_to_b64(comp_shape_counts), _ndarray_to_b64(comp_durations)))
+            else:
+                comparison_js = 'null'
+            js_data = _DURATION_JS_TMPL % {
+                'current': current_js,
+                'comparison': comparison_js,
+                'validation': self._summary_json(),
+                'css': _VALIDATION_CSS_JS,
+                'html': _js_string(validation_html)
+            }
             
             # Add interactive controls and export functionality
-            fig.write_html(
-                filename,
-                include_plotlyjs='cdn',
-                full_html=True,
-                config={
-                    'displayModeBar': True,
-                    'responsive': True,
-                    'modeBarButtonsToAdd': ['drawline', 'drawopenpath', 'eraseshape']
-                },
-                post_script=js_data
-            )
-            
+            self._write_chart(fig, filename, config=_DURATION_CHART_CONFIG, post_script=js_data)
             self.logger.info(f"Generated performance visualization: {filename}")
             return filename
             
@@ -389,479 +1121,318 @@ class PerformanceVisualizer:
             self.logger.error(f"Error generating performance visualization: {str(e)}")
             raise
     
-    def _add_duration_traces(self, fig, shape_counts, durations, row=1, col=1):
-        """Add duration and trend traces to the figure."""
-        # Duration scatter plot
+    def _add_duration_traces(self, fig, shape_counts, durations, row=None, col=None):
+        """Add duration and trend traces to the figure.
+        
+        Returns the (possibly downsampled) points that were plotted.
+        """
+        # Duration scatter plot, with at most a screen's worth of points
+        plot_x, plot_y = _lttb(shape_counts, durations)
+        scatter = _scatter_cls(len(plot_x))
+        if scatter is _plotly().go.Scattergl:
+            fig.update_layout(hoverdistance=1)
+        if len(plot_x) < len(shape_counts):
+            self.logger.info(f"Downsampled {len(shape_counts)} points to {len(plot_x)} for plotting")
         fig.add_trace(
-            go.Scatter(
-                x=shape_counts,
-                y=durations,
+            scatter(
+                x=plot_x,
+                y=plot_y,
                 mode='lines+markers',
                 name='Duration (ms)',
-                line=dict(width=2, color='#1f77b4'),
+                line=dict(width=2, color=_COLOR_LINE),
                 marker=dict(size=10),
-                hovertemplate='Shape Count: %{x}<br>Duration: %{y:.2f} ms<extra></extra>'
+                hovertemplate=_HOVER_DUR
             ),
             row=row, col=col
         )
         
-        # Trend line
-        z = np.polyfit(shape_counts, durations, 1)
-        p = np.poly1d(z)
-        trend_x = np.array(shape_counts)
-        trend_y = p(trend_x)
+        # Trend line, fitted on the full series; skipped when there is no
+        # x spread to fit against
+        if not _can_fit_line(shape_counts):
+            return plot_x, plot_y
+        slope, intercept = _linfit(shape_counts, durations)
+        
+        # A straight line only needs its two endpoints
+        trend_x = np.array([np.min(shape_counts), np.max(shape_counts)])
+        trend_y = slope * trend_x + intercept
         fig.add_trace(
-            go.Scatter(
+            scatter(
                 x=trend_x,
                 y=trend_y,
                 mode='lines',
-                name=f'Trend (slope: {z[0]:.2f})',
-                line=dict(dash='dash', color='#ff7f0e'),
-                hovertemplate='Shape Count: %{x}<br>Predicted: %{y:.2f} ms<extra></extra>'
+                name=f'Trend (slope: {slope:.2f})',
+                line=dict(dash='dash', color=_COLOR_TREND),
+                hovertemplate=_HOVER_TREND
             ),
             row=row, col=col
         )
+        
+        return plot_x, plot_y
     
     def _apply_filters(self, values, filters):
-        """Apply filters to data series."""
-        indices = []
-        for i, value in enumerate(values):
-            include = True
-            for filter_key, filter_value in filters.items():
-                if filter_key == 'min_value' and value < filter_value:
-                    include = False
-                elif filter_key == 'max_value' and value > filter_value:
-                    include = False
-                elif filter_key == 'value_range':
-                    min_val, max_val = filter_value
-                    if value < min_val or value > max_val:
-                        include = False
-            if include:
-                indices.append(i)
-        return indices
-    
-    def plot_memory_usage(self, shape_counts, memory_usage, test_type='batch'):
+        """Apply filters to data series, returning a boolean mask of points to keep."""
+        arr = np.asarray(values)
+        mask = np.ones(arr.shape, dtype=bool)
+        for filter_key, filter_value in filters.items():
+            if filter_key == 'min_value':
+                mask &= arr >= filter_value
+            elif filter_key == 'max_value':
+                mask &= arr <= filter_value
+            elif filter_key == 'value_range':
+                min_val, max_val = filter_value
+                mask &= (arr >= min_val) & (arr <= max_val)
+        return mask
+    
+    def plot_memory_usage(self, shape_counts, memory_usage, test_type='batch', timestamp=None):
         """Generate interactive bar plot of memory usage per test scenario."""
+        # Float64 arrays let Plotly ship x and y as binary typed arrays
+        shape_counts = np.asarray(shape_counts, dtype=np.float64)
+        memory_usage = np.asarray(memory_usage, dtype=np.float64)
+        filename, reused = self._chart_file(f'memory_usage_{test_type}', timestamp,
+                                            shape_counts, memory_usage)
+        if reused:
+            return filename
+        
+        go = _plotly().go
         fig = go.Figure()
         
-        # Add memory usage bars
+        # Add memory usage bars, labelled with their value on top. The labels
+        # are formatted client-side from y.
         fig.add_trace(go.Bar(
             x=shape_counts,
             y=memory_usage,
             name='Memory Usage',
-            marker_color='#2ecc71',
+            marker_color=_COLOR_MEMORY,
             opacity=0.7,
-            hovertemplate='Shape Count: %{x}<br>Memory: %{y:.1f} MB<extra></extra>'
+            texttemplate='%{y:.1f} MB',
+            textposition='outside',
+            textfont=dict(size=12),
+            hovertemplate=_HOVER_MEMORY
         ))
         
-        # Add value labels on top of bars
-        for i, value in enumerate(memory_usage):
-            fig.add_annotation(
-                x=shape_counts[i],
-                y=value,
-                text=f'{value:.1f} MB',
-                showarrow=False,
-                yshift=10,
-                font=dict(size=12)
-            )
-        
         fig.update_layout(
-            title=dict(
-                text=f'Memory Usage per {test_type.title()} Test Scenario',
-                x=0.5,
-                font=dict(size=20)
-            ),
-            xaxis_title=dict(text='Shape Count', font=dict(size=14)),
-            yaxis_title=dict(text='Memory Usage (MB)', font=dict(size=14)),
-            hovermode='closest',
-            showlegend=False,
-            margin=dict(t=100, l=80, r=80, b=80)
+            title_text=f'Memory Usage per {test_type.title()} Test Scenario',
+            xaxis_title_text='Shape Count',
+            yaxis_title_text='Memory Usage (MB)',
+            showlegend=False
         )
         
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f'{self.output_dir}/memory_usage_{test_type}_{timestamp}.html'
-        fig.write_html(
-            filename,
-            include_plotlyjs='cdn',
-            full_html=True,
-            config={'displayModeBar': True, 'responsive': True}
-        )
+        self._write_chart(fig, filename)
         
         return filename
     
-    def plot_performance_scatter(self, x_values, y_values, x_label, y_label, title):
+    def _scatter_hover_templates(self, x_label, y_label):
+        """Get the point and trend hover templates for a pair of axis labels."""
+        key = (x_label, y_label)
+        templates = self._hover_cache.get(key)
+        if templates is None:
+            templates = self._hover_cache[key] = (
+                _HOVER_SCATTER_TMPL % key,
+                _HOVER_SCATTER_TREND_TMPL % key
+            )
+        return templates
+    
+    def plot_performance_scatter(self, x_values, y_values, x_label, y_label, title,
+                                 timestamp=None):
         """Generate interactive scatter plot with trend line."""
+        x_values = np.asarray(x_values, dtype=np.float64)
+        y_values = np.asarray(y_values, dtype=np.float64)
+        safe_title = title.lower().replace(' ', '_')
+        filename, reused = self._chart_file(f'scatter_{safe_title}', timestamp,
+                                            x_values, y_values, x_label, y_label, title)
+        if reused:
+            return filename
+        
+        go = _plotly().go
         fig = go.Figure()
+        hover_points, hover_trend = self._scatter_hover_templates(x_label, y_label)
         
-        # Add scatter plot
-        fig.add_trace(go.Scatter(
-            x=x_values,
-            y=y_values,
+        # Add scatter plot, downsampled to at most a screen's worth of points
+        plot_x, plot_y = _lttb(x_values, y_values)
+        scatter = _scatter_cls(len(plot_x))
+        if scatter is go.Scattergl:
+            fig.update_layout(hoverdistance=1)
+        fig.add_trace(scatter(
+            x=plot_x,
+            y=plot_y,
             mode='markers',
             name='Data Points',
             marker=dict(
                 size=12,
-                color='#3498db',
+                color=_COLOR_POINTS,
                 opacity=0.6,
-                line=dict(width=1, color='#2980b9')
+                line=dict(width=1, color=_COLOR_POINTS_EDGE)
             ),
-            hovertemplate=f'{x_label}: %{{x}}<br>{y_label}: %{{y:.2f}}<extra></extra>'
+            hovertemplate=hover_points
         ))
         
-        # Add trend line
-        z = np.polyfit(x_values, y_values, 1)
-        p = np.poly1d(z)
-        trend_x = np.array(x_values)
-        trend_y = p(trend_x)
-        fig.add_trace(go.Scatter(
-            x=trend_x,
-            y=trend_y,
-            mode='lines',
-            name=f'Trend (slope: {z[0]:.2f})',
-            line=dict(dash='dash', color='#e74c3c'),
-            hovertemplate=f'{x_label}: %{{x}}<br>Predicted {y_label}: %{{y:.2f}}<extra></extra>'
-        ))
+        # Add trend line when there is an x spread to fit against
+        if _can_fit_line(x_values):
+            slope, intercept = _linfit(x_values, y_values)
+            trend_x = np.array([np.min(x_values), np.max(x_values)])
+            trend_y = slope * trend_x + intercept
+            fig.add_trace(scatter(
+                x=trend_x,
+                y=trend_y,
+                mode='lines',
+                name=f'Trend (slope: {slope:.2f})',
+                line=dict(dash='dash', color=_COLOR_SCATTER_TREND),
+                hovertemplate=hover_trend
+            ))
         
         fig.update_layout(
-            title=dict(
-                text=title,
-                x=0.5,
-                font=dict(size=20)
-            ),
-            xaxis_title=dict(text=x_label, font=dict(size=14)),
-            yaxis_title=dict(text=y_label, font=dict(size=14)),
-            hovermode='closest',
-            showlegend=True,
-            legend=dict(
-                yanchor="top",
-                y=0.99,
-                xanchor="right",
-                x=0.99
-            ),
-            margin=dict(t=100, l=80, r=80, b=80)
+            title_text=title,
+            xaxis_title_text=x_label,
+            yaxis_title_text=y_label
         )
         
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        safe_title = title.lower().replace(' ', '_')
-        filename = f'{self.output_dir}/scatter_{safe_title}_{timestamp}.html'
-        fig.write_html(
-            filename,
-            include_plotlyjs='cdn',
-            full_html=True,
-            config={'displayModeBar': True, 'responsive': True}
-        )
+        self._write_chart(fig, filename)
         
         return filename
     
-    def generate_html_report(self, test_data, chart_files):
-        """Generate an HTML report with interactive visualizations and export functionality."""
-        # Add CSS for progress indicator and status messages
-        css = """
-            .progress-container {
-                width: 100%;
-                margin: 10px 0;
-                display: none;
-            }
-            .progress-bar {
-                width: 0%;
-                height: 4px;
-                background-color: #4CAF50;
-                transition: width 0.3s ease-in-out;
-            }
-            .status-message {
-                margin: 5px 0;
-                padding: 8px;
-                border-radius: 4px;
-                display: none;
-            }
-            .status-success {
-                background-color: #E8F5E9;
-                color: #2E7D32;
-                border: 1px solid #A5D6A7;
-            }
-            .status-error {
-                background-color: #FFEBEE;
-                color: #C62828;
-                border: 1px solid #FFCDD2;
-            }
-            .status-warning {
-                background-color: #FFF3E0;
-                color: #EF6C00;
-                border: 1px solid #FFE0B2;
-            }
-            .status-info {
-                background-color: #E3F2FD;
-                color: #1565C0;
-                border: 1px solid #90CAF9;
-            }
+    def generate_all(self, shape_counts, durations, memory_usage, test_type='batch',
+                     scatter_title=None):
+        """Generate the duration, memory and optional scaling charts in parallel.
+        
+        Each chart is encoded and written on its own worker thread. Returns
+        the chart files in that order, ready for generate_html_report.
         """
-
-        # Add JavaScript for progress and status handling
-        js = """
-            function showProgress(show = true) {
-                document.querySelector('.progress-container').style.display = show ? 'block' : 'none';
-            }
-
-            function updateProgress(percent) {
-                document.querySelector('.progress-bar').style.width = `${percent}%`;
-            }
-
-            function showStatus(message, type = 'info') {
-                const statusEl = document.querySelector('.status-message');
-                statusEl.textContent = message;
-                statusEl.className = `status-message status-${type}`;
-                statusEl.style.display = 'block';
-                
-                // Auto-hide success messages after 3 seconds
-                if (type === 'success') {
-                    setTimeout(() => {
-                        statusEl.style.display = 'none';
-                    }, 3000);
-                }
-            }
-
-            async function exportData(format) {
-                showProgress();
-                showStatus('Preparing data for export...', 'info');
-                
-                try {
-                    // Validate data
-                    updateProgress(20);
-                    const validationResult = validateDataArrays(window.currentData.shape_counts, window.currentData.durations);
-                    if (!validationResult.isValid) {
-                        throw new Error(validationResult.error);
-                    }
-                    
-                    // Sanitize data
-                    updateProgress(40);
-                    const sanitizedData = sanitizeDataForExport(window.currentData);
-                    
-                    // Format data
-                    updateProgress(60);
-                    let exportContent;
-                    let filename;
-                    const timestamp = new Date().toISOString().slice(0,19).replace(/[:-]/g, '');
-                    
-                    switch(format) {
-                        case 'csv':
-                            exportContent = formatCSV(sanitizedData);
-                            filename = `performance_data_${timestamp}.csv`;
-                            break;
-                        case 'json':
-                            exportContent = formatJSON(sanitizedData);
-                            filename = `performance_data_${timestamp}.json`;
-                            break;
-                        case 'excel':
-                            exportContent = formatExcel(sanitizedData);
-                            filename = `performance_data_${timestamp}.xls`;
-                            break;
-                        default:
-                            throw new Error(`Unsupported format: ${format}`);
-                    }
-                    
-                    // Create and trigger download
-                    updateProgress(80);
-                    const blob = new Blob([exportContent], { type: getMimeType(format) });
-                    const url = URL.createObjectURL(blob);
-                    const a = document.createElement('a');
-                    a.href = url;
-                    a.download = filename;
-                    document.body.appendChild(a);
-                    a.click();
-                    document.body.removeChild(a);
-                    URL.revokeObjectURL(url);
-                    
-                    updateProgress(100);
-                    showStatus(`Data exported successfully as ${format.toUpperCase()}`, 'success');
-                } catch (error) {
-                    showStatus(error.message, 'error');
-                } finally {
-                    setTimeout(() => {
-                        showProgress(false);
-                        updateProgress(0);
-                    }, 1000);
-                }
-            }
-
-            async function exportComparisonData(format) {
-                showProgress();
-                showStatus('Preparing comparison data for export...', 'info');
-                
-                try {
-                    // Validate both datasets
-                    updateProgress(20);
-                    const currentValidation = validateDataArrays(window.currentData.shape_counts, window.currentData.durations);
-                    const comparisonValidation = validateDataArrays(window.comparisonData.shape_counts, window.comparisonData.durations);
-                    
-                    if (!currentValidation.isValid || !comparisonValidation.isValid) {
-                        throw new Error('Invalid data in current or comparison dataset');
-                    }
-                    
-                    // Validate matching shape counts
-                    if (!arraysMatch(window.currentData.shape_counts, window.comparisonData.shape_counts)) {
-                        throw new Error('Shape counts in current and comparison data do not match');
-                    }
-                    
-                    // Sanitize both datasets
-                    updateProgress(40);
-                    const sanitizedCurrent = sanitizeDataForExport(window.currentData);
-                    const sanitizedComparison = sanitizeDataForExport(window.comparisonData);
-                    
-                    // Format data
-                    updateProgress(60);
-                    let exportContent;
-                    let filename;
-                    const timestamp = new Date().toISOString().slice(0,19).replace(/[:-]/g, '');
-                    
-                    switch(format) {
-                        case 'csv':
-                            exportContent = formatComparisonCSV(sanitizedCurrent, sanitizedComparison);
-                            filename = `comparison_data_${timestamp}.csv`;
-                            break;
-                        case 'json':
-                            exportContent = formatComparisonJSON(sanitizedCurrent, sanitizedComparison);
-                            filename = `comparison_data_${timestamp}.json`;
-                            break;
-                        case 'excel':
-                            exportContent = formatComparisonExcel(sanitizedCurrent, sanitizedComparison);
-                            filename = `comparison_data_${timestamp}.xls`;
-                            break;
-                        default:
-                            throw new Error(`Unsupported format: ${format}`);
-                    }
-                    
-                    // Create and trigger download
-                    updateProgress(80);
-                    const blob = new Blob([exportContent], { type: getMimeType(format) });
-                    const url = URL.createObjectURL(blob);
-                    const a = document.createElement('a');
-                    a.href = url;
-                    a.download = filename;
-                    document.body.appendChild(a);
-                    a.click();
-                    document.body.removeChild(a);
-                    URL.revokeObjectURL(url);
-                    
-                    updateProgress(100);
-                    showStatus(`Comparison data exported successfully as ${format.toUpperCase()}`, 'success');
-                } catch (error) {
-                    showStatus(error.message, 'error');
-                } finally {
-                    setTimeout(() => {
-                        showProgress(false);
-                        updateProgress(0);
-                    }, 1000);
-                }
-            }
+        # Settle the shared run timestamp and plotly.js bundle up front so
+        # workers never race to create them
+        self._now()
+        self._plotlyjs_src()
+        
+        jobs = [
+            (self.plot_transform_durations, (shape_counts, durations, test_type)),
+            (self.plot_memory_usage, (shape_counts, memory_usage, test_type))
+        ]
+        if scatter_title:
+            jobs.append((self.plot_performance_scatter,
+                         (shape_counts, durations, 'Shape Count', 'Duration (ms)', scatter_title)))
+        
+        with ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as executor:
+            futures = [executor.submit(plot, *args) for plot, args in jobs]
+            return [future.result() for future in futures]
+    
+    def render_batch(self, chart_specs: List[Tuple[str, 'go.Figure']],
+                     title: str = 'Performance Charts') -> str:
+        """Render several figures into one HTML page with a single plotly.js load.
+        
+        ``chart_specs`` holds (chart title, figure) pairs. Returns the path of
+        the written page.
         """
-
-        # Generate HTML content
-        html = f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <title>Performance Test Report</title>
-                <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
-                <style>{css}</style>
-            </head>
-            <body>
-                <div class="container mt-4">
-                    <h1 class="mb-4">Performance Test Report</h1>
-                    
-                    <!-- Progress and Status -->
-                    <div class="progress-container">
-                        <div class="progress-bar"></div>
-                    </div>
-                    <div class="status-message"></div>
-                    
-                    <!-- Export Controls -->
-                    <div class="export-controls mb-4">
-                        <h3>Export Options</h3>
-                        <div class="button-group">
-                            <button onclick="exportData('csv')" class="btn btn-primary">Export as CSV</button>
-                            <button onclick="exportData('json')" class="btn btn-primary">Export as JSON</button>
-                            <button onclick="exportData('excel')" class="btn btn-primary">Export as Excel</button>
-                        </div>
-                        
-                        {{% if has_comparison_data %}}
-                        <div class="button-group mt-2">
-                            <button onclick="exportComparisonData('csv')" class="btn btn-secondary">Export Comparison as CSV</button>
-                            <button onclick="exportComparisonData('json')" class="btn btn-secondary">Export Comparison as JSON</button>
-                            <button onclick="exportComparisonData('excel')" class="btn btn-secondary">Export Comparison as Excel</button>
-                        </div>
-                        {{% endif %}}
+        self._ensure(self.output_dir)
+        filename = os.path.join(self.output_dir, f'charts_{self._file_stamp()}.html')
+        with _atomic_write(filename) as f:
+            f.write(_BATCH_HEAD_TMPL % (title, self._plotlyjs_src()))
+            f.writelines(_INLINE_CHART_TMPL % (chart_title, f'chart_{i}')
+                         for i, (chart_title, _) in enumerate(chart_specs))
+            f.write('\n<script>')
+            f.write(_chart_script((f'chart_{i}', fig) for i, (_, fig) in enumerate(chart_specs)))
+            f.write('</script>')
+            f.write(_BATCH_TAIL)
+        return filename
+    
+    def generate_html_report(self, test_data, chart_files, compress=False):
+        """Generate an HTML report with interactive visualizations and export functionality.
+        
+        With compress, the report is written gzipped as a .html.gz file.
+        """
+        # Write the report fragment by fragment instead of assembling one
+        # report-sized string first
+        self._ensure(self.output_dir)
+        timestamp = self._file_stamp()
+        report_file = os.path.join(self.output_dir, f'performance_report_{timestamp}.html')
+        if compress:
+            report_file += '.gz'
+        with contextlib.ExitStack() as stack:
+            f = stack.enter_context(_atomic_write(report_file, binary=compress))
+            if compress:
+                gz = stack.enter_context(gzip.GzipFile(fileobj=f, mode='wb', compresslevel=6))
+                f = stack.enter_context(io.TextIOWrapper(gz, encoding='utf-8'))
+            write = f.write
+            write(_HTML_HEAD_TMPL % self._plotlyjs_src())
+            write(_HTML_PREFIX)
+            if test_data.get('comparison_data'):
+                write(_COMP_BUTTONS_HTML)
+            write("""
                     </div>
                     
                     <!-- Test Results -->
-                    {self._generate_test_results_section(test_data)}
+                    """)
+            write(self._generate_test_results_section(test_data))
+            write("""
                     
                     <!-- Charts -->
-                    {self._generate_chart_sections(chart_files)}
+                    """)
+            f.writelines(self._iter_chart_sections(chart_files))
+            write("""
                     
                     <!-- System Info -->
-                    {self._generate_system_info_section(test_data.get('system_info', {}))}
+                    """)
+            f.writelines(self._iter_system_info_section(test_data.get('system_info', {})))
+            write("""
                     
                     <!-- Recommendations -->
-                    {self._generate_recommendation_sections(test_data.get('recommendations', []))}
-                </div>
-                
-                <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
-                <script>{js}</script>
-            </body>
-            </html>
-        """
-
-        # Save report
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        report_file = os.path.join(self.output_dir, f'performance_report_{timestamp}.html')
-        with open(report_file, 'w') as f:
-            f.write(html)
+                    """)
+            f.writelines(self._iter_recommendation_sections(test_data.get('recommendations', [])))
+            write(_HTML_SCRIPTS_OPEN)
+            write(self._generate_chart_script(chart_files))
+            write(_HTML_SUFFIX)
         
+        # The charts are in the report now; don't keep their data arrays
+        # alive for the rest of a long-running visualizer's life
+        self._chart_figures.clear()
         return report_file
     
-    def _generate_chart_sections(self, chart_files):
-        """Generate HTML sections for interactive charts."""
-        sections = []
-        for chart_file in chart_files:
+    def _iter_chart_sections(self, chart_files):
+        """Yield HTML sections for interactive charts."""
+        for i, chart_file in enumerate(chart_files):
             filename = os.path.basename(chart_file)
             title = ' '.join(word.title() for word in filename.split('_')[:2])
-            sections.append(f"""
-                <div class="visualization">
-                    <h3>{title}</h3>
-                    <iframe src="{chart_file}"></iframe>
-                </div>
-            """)
-        return '\n'.join(sections)
+            if chart_file in self._chart_figures:
+                yield _INLINE_CHART_TMPL % (title, f'chart_{i}')
+            else:
+                yield _CHART_TMPL % (title, chart_file)
+            yield '\n'
     
-    def _generate_recommendation_sections(self, recommendations):
-        """Generate HTML sections for recommendations."""
-        sections = []
+    def _generate_chart_script(self, chart_files):
+        """Generate the script rendering inline charts into their placeholders."""
+        figures = self._chart_figures
+        return _chart_script((f'chart_{i}', figures[chart_file])
+                             for i, chart_file in enumerate(chart_files)
+                             if chart_file in figures)
+    
+    def _iter_recommendation_sections(self, recommendations):
+        """Yield HTML sections for recommendations."""
         for rec in recommendations:
-            sections.append(f"""
-                <div class="recommendation {rec['priority']}">
-                    <h4>{rec['message']}</h4>
-                    <p>{rec['details']}</p>
-                </div>
-            """)
-        return '\n'.join(sections)
+            yield _REC_TMPL % (rec['priority'], rec['message'], rec['details'])
+            yield '\n'
     
-    def _generate_system_info_section(self, system_info):
-        """Generate HTML section for system information."""
-        items = []
+    def _iter_system_info_section(self, system_info):
+        """Yield the HTML section for system information."""
+        yield _SYS_LIST_OPEN
         for key, value in system_info.items():
             if 'memory' in key.lower():
                 value = f"{value / (1024**3):.2f} GB"
-            items.append(f"<li><strong>{key.replace('_', ' ').title()}:</strong> {value}</li>")
-        return f"<ul style='list-style-type: none; padding: 0;'>{''.join(items)}</ul>"
-    
-    def _get_success_rate_color(self, report_data):
-        """Get color for success rate based on percentage."""
-        success_rate = ((report_data['test_results']['tests_run'] - 
-                        report_data['test_results']['failures']) / 
-                       report_data['test_results']['tests_run'] * 100)
+            yield _SYS_ITEM_TMPL % (key.translate(_KEY_TRANSLATION).title(), value)
+        yield _SYS_LIST_CLOSE
+    
+    def _generate_test_results_section(self, test_data):
+        """Generate the test results summary, colored by success rate."""
+        results = test_data.get('test_results')
+        if not results:
+            return ''
+        
+        # Success rate and its color are derived once per report
+        tests_run = results['tests_run']
+        failures = results['failures']
+        success_rate = (tests_run - failures) / max(tests_run, 1) * 100
         if success_rate >= 90:
-            return '#00C851'  # Green
+            color = '#00C851'  # Green
         elif success_rate >= 75:
-            return '#ffbb33'  # Yellow
+            color = '#ffbb33'  # Yellow
         else:
-            return '#ff4444'  # Red 
\ No newline at end of file
+            color = '#ff4444'  # Red
+        return _TEST_RESULTS_TMPL % (tests_run, failures, results.get('errors', 0),
+                                     color, success_rate)
@@ -0,0 +1,57 @@
+"""
+Tests for the main window layout and keyboard shortcuts.
+"""
+
+import pytest
+from window_layout import compute_viewport_size
+
+@pytest.mark.parametrize("window_size,expected", [
+    ((1200, 800), (800, 800)),
+    ((900, 600), (600, 600)),
+    ((1000, 700), (666, 700)),
+])
+def test_compute_viewport_size(window_size, expected):
+    """Test the viewport gets its stretch share of the width and the full height."""
+    assert compute_viewport_size(*window_size) == expected
+
+def test_compute_viewport_size_custom_fracs():
+    """Test custom stretch factors split the width accordingly."""
+    assert compute_viewport_size(1200, 800, (1, 1)) == (600, 800)
+
+def test_viewport_resize(main_window, qtbot):
+    """Test resizing the window gives the viewport the larger share."""
+    main_window.resize(1500, 900)
+    main_window.show()
+    qtbot.waitExposed(main_window)
+    assert main_window.viewport.width() > main_window.tab_widget.width()
+    assert main_window.viewport.height() > main_window.height() // 2
+
+def test_shortcut_sets_transform_mode(main_window):
+    """Test a mode key runs its shortcut action directly."""
+    from PyQt6.QtCore import Qt
+    assert main_window._handle_shortcut(Qt.Key.Key_T)
+    assert main_window.viewport.transform_mode == 'translate'
+
+def test_shortcut_cancels_transform(main_window):
+    """Test Escape leaves transform mode."""
+    from PyQt6.QtCore import Qt
+    main_window._handle_shortcut(Qt.Key.Key_R)
+    assert main_window._handle_shortcut(Qt.Key.Key_Escape)
+    assert main_window.viewport.transform_mode is None
+    assert main_window.viewport.status_message == "Transform Cancelled"
+
+def test_unbound_key_has_no_shortcut(main_window):
+    """Test a key without a shortcut is reported as unhandled."""
+    from PyQt6.QtCore import Qt
+    assert not main_window._handle_shortcut(Qt.Key.Key_Q)
+    assert not main_window._handle_shortcut(Qt.Key.Key_T, Qt.KeyboardModifier.ControlModifier)
+    assert main_window.viewport.transform_mode is None
+
+def test_shortcut_key_click(main_window, qtbot):
+    """Test a real key press reaches the shortcut wiring."""
+    from PyQt6.QtCore import Qt
+    main_window.show()
+    main_window.activateWindow()
+    qtbot.waitExposed(main_window)
+    qtbot.keyClick(main_window, Qt.Key.Key_S)
+    assert main_window.viewport.transform_mode == 'scale'
@@ -598,14 +598,18 @@ class TestTransformIntegration(unittest.TestCase):
             self.assertIn('onclick="exportComparisonData(\'excel\')"', content)
 
     def test_export_directory_creation(self):
-        """Test that export directory is created correctly."""
+        """Test that output directories are created on first write."""
         output_dir = 'test_reports_export'
         visualizer = PerformanceVisualizer(output_dir=output_dir)
         
+        # Nothing is created until something is written
+        self.assertFalse(os.path.exists(output_dir))
+        self.assertEqual(visualizer.list_available_runs(), [])
+        
         # Verify directories were created
+        visualizer.save_test_data({'shape_counts': [100], 'durations': [50]})
         self.assertTrue(os.path.exists(output_dir))
         self.assertTrue(os.path.exists(os.path.join(output_dir, 'data')))
-        self.assertTrue(os.path.exists(os.path.join(output_dir, 'exports')))
         
         # Clean up test directory
         import shutil
@@ -10,7 +10,8 @@ from PyQt6.QtCore import Qt, pyqtSignal, QDateTime, QTimer, QPropertyAnimation,
 from PyQt6.QtGui import QIcon
 import json
 import os
-from typing import Dict, List, Set
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Set
 import numpy as np
 import time
 
@@ -230,14 +231,14 @@ class TransformTab(QWidget):
     ANIMATION_BATCH_SIZE = 5  # Number of UI updates to batch during transitions
     
     # Update signal to support multiple axes
-    transformPreviewRequested = Signal(str, dict)  # (transform_type, {axis: value})
-    transformApplied = Signal()
+    transformPreviewRequested = pyqtSignal(str, dict)  # (transform_type, {axis: value})
+    transformApplied = pyqtSignal()
     
     # Add new signals for enhanced feedback
-    mode_transition_started = Signal(str, str)  # old_mode, new_mode
-    mode_transition_completed = Signal(str)  # new_mode
-    transform_state_changed = Signal(dict)  # transform_state
-    performance_warning = Signal(str)  # warning message
+    mode_transition_started = pyqtSignal(str, str)  # old_mode, new_mode
+    mode_transition_completed = pyqtSignal(str)  # new_mode
+    transform_state_changed = pyqtSignal(dict)  # transform_state
+    performance_warning = pyqtSignal(str)  # warning message
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -519,7 +520,7 @@ class TransformTab(QWidget):
             return
             
         # Get final transform values
-        transform_values = {a: sb.value() for a, sb in self._active_axes.items()}
+        transform_values = self._active_values()
         
         # Add to history
         self._history.append({
@@ -573,7 +574,42 @@ class TransformTab(QWidget):
             self.scale_x.setValue(1.0)
             self.scale_y.setValue(1.0)
             self.scale_z.setValue(1.0)
-            
+
+    def _get_spinbox_for_axis(self, axis):
+        """Get the spinbox for an axis in the current transform mode."""
+        return getattr(self, f"{self.current_transform_mode}_{axis}")
+
+    def set_values(self, values):
+        """Set several axes at once with a single preview update.
+
+        Args:
+            values: {axis: value} for the current transform mode
+        """
+        for axis, value in values.items():
+            spinbox = self._get_spinbox_for_axis(axis)
+            # Block per-spinbox signals so the preview is rebuilt once, not per axis
+            spinbox.blockSignals(True)
+            spinbox.setValue(value)
+            spinbox.blockSignals(False)
+            self._active_axes[axis] = spinbox
+
+        self._preview_active = True
+        self._emit_preview()
+
+    def _active_values(self):
+        """Read {axis: value} for the active axes from their spinboxes."""
+        return {a: sb.value() for a, sb in self._active_axes.items()}
+
+    def get_active_values(self) -> Mapping[str, float]:
+        """Get a read-only {axis: value} snapshot of the active axes."""
+        return MappingProxyType(self._active_values())
+
+    def _emit_preview(self):
+        """Emit a preview request with the values of all active axes."""
+        values = self._active_values()
+        self.transformPreviewRequested.emit(self.current_transform_mode, values)
+        self._log_preview_update(values)
+
     def _log_preview_update(self, values):
         """Log preview updates for debugging."""
         print(f"Preview update - Mode: {self.current_transform_mode}, Values: {values}")
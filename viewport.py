@@ -2,6 +2,7 @@ from PyQt6.QtWidgets import QOpenGLWidget
 from PyQt6.QtCore import Qt, QPoint, QTimer
 from PyQt6.QtGui import QMatrix4x4, QVector3D, QVector4D, QPainter, QColor, QRect
 from OpenGL.GL import *
+import functools
 import numpy as np
 from shapes_3d import SceneManager, Cube
 from src.core.utils import (
@@ -11,6 +12,16 @@ from src.core.utils import (
     qmatrix4x4_to_numpy
 )
 
+# Unit circle sampled at whole degrees, for the rotation snap ticks
+_COS_DEG = np.cos(np.radians(np.arange(360))).tolist()
+_SIN_DEG = np.sin(np.radians(np.arange(360))).tolist()
+
+@functools.lru_cache(maxsize=8)
+def _circle_points(segments):
+    """Get (cos, sin) pairs for evenly spaced angles around the unit circle."""
+    angles = np.radians(np.arange(segments) * 360 / segments)
+    return tuple(zip(np.cos(angles).tolist(), np.sin(angles).tolist()))
+
 class Viewport(QOpenGLWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -294,22 +305,20 @@ class Viewport(QOpenGLWidget):
         segments = int(360 / min(angle_snap, 15))  # At least 24 segments
         
         glBegin(GL_LINE_LOOP)
-        for i in range(segments):
-            angle = np.radians(i * 360 / segments)
+        for cos, sin in _circle_points(segments):
             if active_axis == 'x':
-                glVertex3f(0, radius * np.cos(angle), radius * np.sin(angle))
+                glVertex3f(0, radius * cos, radius * sin)
             elif active_axis == 'y':
-                glVertex3f(radius * np.cos(angle), 0, radius * np.sin(angle))
+                glVertex3f(radius * cos, 0, radius * sin)
             else:  # z
-                glVertex3f(radius * np.cos(angle), radius * np.sin(angle), 0)
+                glVertex3f(radius * cos, radius * sin, 0)
         glEnd()
         
         # Draw snap angles
         glBegin(GL_LINES)
         for angle in range(0, 360, int(angle_snap)):
-            rad = np.radians(angle)
-            cos = radius * np.cos(rad)
-            sin = radius * np.sin(rad)
+            cos = radius * _COS_DEG[angle]
+            sin = radius * _SIN_DEG[angle]
             
             if active_axis == 'x':
                 glVertex3f(0, cos, sin)
@@ -0,0 +1,12 @@
+# Horizontal stretch factors of the viewport and the tab panel
+VIEWPORT_STRETCH = 2
+PANEL_STRETCH = 1
+
+def compute_viewport_size(window_w, window_h, layout_fracs=(VIEWPORT_STRETCH, PANEL_STRETCH)):
+    """Get the viewport's (width, height) for a main window content size.
+    
+    The viewport takes its stretch share of the width, with layout_fracs
+    holding the viewport's and tab panel's stretch factors, and the full
+    height. Layout margins and spacing are not accounted for.
+    """
+    return window_w * layout_fracs[0] // sum(layout_fracs), window_h